@@ -43,9 +43,14 @@ CREATE TABLE IF NOT EXISTS dicom_metadata (
     SegmentationProfile TEXT,
     SegmentationTasks TEXT,
     SegmentationCompletedAt TIMESTAMP,
+    FileSizeBytes INTEGER,       -- Canonical NIfTI size, recorded by segmentation
     
     -- Timestamps
-    ProcessedAt TIMESTAMP
+    ProcessedAt TIMESTAMP,
+
+    -- Derived lookup key (virtual, computed from IdJson)
+    CaseID TEXT GENERATED ALWAYS AS
+        (CASE WHEN json_valid(IdJson) THEN json_extract(IdJson, '$.CaseID') END) VIRTUAL
 );
 
 CREATE INDEX IF NOT EXISTS idx_dicom_metadata_l1_hu_mean
@@ -303,6 +308,7 @@ CREATE INDEX IF NOT EXISTS idx_accession ON dicom_metadata(AccessionNumber);
 CREATE INDEX IF NOT EXISTS idx_study_date ON dicom_metadata(StudyDate);
 CREATE INDEX IF NOT EXISTS idx_modality ON dicom_metadata(Modality);
 CREATE INDEX IF NOT EXISTS idx_processed_at ON dicom_metadata(ProcessedAt);
+CREATE INDEX IF NOT EXISTS idx_dicom_metadata_case_id ON dicom_metadata(CaseID);
 CREATE INDEX IF NOT EXISTS idx_segmentation_queue_status_created ON segmentation_queue(status, created_at);
 CREATE INDEX IF NOT EXISTS idx_metrics_queue_status_created ON metrics_queue(status, created_at);
 CREATE INDEX IF NOT EXISTS idx_dicom_egress_queue_status_next_attempt ON dicom_egress_queue(status, next_attempt_at, created_at);
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
+
 from fastapi import FastAPI
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from ..shared import settings
@@ -12,12 +15,38 @@ from .routers.patients import router as patients_router
 from .routers.studies import router as studies_router
 from .routers.upload import router as upload_router
 
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESS_LEVEL = 4
+
+# Routes that stream files which are already compressed (NIfTI, ZIP, PNG, PDF)
+# or arbitrary case artifacts; re-gzipping them only burns CPU.
+_UNCOMPRESSED_PATH = re.compile(r"^/api/patients/[^/]+/(?:nifti|report\.pdf|download/|images/|artifacts/)")
+
+
+class _PayloadGZipMiddleware:
+    """Gzip JSON and HTML responses while passing binary downloads through."""
+
+    def __init__(self, app, *, minimum_size: int, compresslevel: int) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not _UNCOMPRESSED_PATH.match(scope.get("path", "")):
+            await self.gzip_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
 
 def create_app() -> FastAPI:
     """Build the operational API application."""
     settings.ensure_directories()
 
     app = FastAPI(title=settings.SERVER_TITLE)
+    app.add_middleware(
+        _PayloadGZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL,
+    )
     app.include_router(dashboard_router)
     app.include_router(ops_router)
     app.include_router(upload_router)
@@ -1,23 +1,32 @@
 import json
 import logging
+import re
 import sqlite3
 
 from heimdallr.shared import store
 from heimdallr.shared import settings
 from heimdallr.shared.patient_names import normalize_patient_name_display
 from heimdallr.shared.paths import study_derived_dir, study_dir, study_results_json
+from heimdallr.shared.schemas import PatientListResponse
 
 logger = logging.getLogger(__name__)
 
+# Database path -> (dicom_metadata revision, encoded PatientListResponse body).
+_patient_list_cache: dict[str, tuple[int, bytes]] = {}
+
+
+_ELAPSED_HMS_RE = re.compile(r"^\s*(\d+):(\d+):(\d+(?:\.\d*)?)\s*$")
+
 
 def parse_elapsed_seconds(elapsed_str):
-    if not elapsed_str or ":" not in elapsed_str:
+    """Return whole seconds for an ``H:MM:SS[.ffffff]`` string, else 0."""
+    if not isinstance(elapsed_str, str):
         return 0
-    try:
-        h, m, s = elapsed_str.split(':')
-        return int(int(h) * 3600 + int(m) * 60 + float(s))
-    except Exception:
+    match = _ELAPSED_HMS_RE.match(elapsed_str)
+    if match is None:
         return 0
+    hours, minutes, seconds = match.groups()
+    return int(int(hours) * 3600 + int(minutes) * 60 + float(seconds))
 
 class PatientService:
     @staticmethod
@@ -26,100 +35,128 @@ class PatientService:
         Fetch all patients from the database.
         Calculates elapsed seconds, hemorrhage status, etc., natively instead of hitting the filesystem.
         """
-        patients = []
         try:
-            rows = store.list_patient_rows(db)
+            return PatientService._render_patient_list(db)
+        except Exception as e:
+            logger.error(f"Error fetching patients from DB: {e}")
+            return []
+
+    @staticmethod
+    def get_patient_list_json(db: sqlite3.Connection) -> bytes:
+        """Return the encoded patient list body, reused until dicom_metadata changes."""
+        try:
+            # Any write to dicom_metadata bumps the revision, so an unchanged
+            # revision means the encoded body is still current.
+            cache_key = str(settings.DB_PATH)
+            revision = store.get_dicom_metadata_revision(db)
+            cached = _patient_list_cache.get(cache_key)
+            if cached is not None and cached[0] == revision:
+                return cached[1]
+
+            patients = PatientService._render_patient_list(db)
+            # Validate and encode in one pydantic-core pass.
+            payload = PatientListResponse(patients=patients).model_dump_json().encode()
+            _patient_list_cache[cache_key] = (revision, payload)
+            return payload
+        except Exception as e:
+            logger.error(f"Error fetching patients from DB: {e}")
+            return PatientListResponse(patients=[]).model_dump_json().encode()
+
+    @staticmethod
+    def _render_patient_list(db: sqlite3.Connection) -> list[dict]:
+        patients = []
+        rows = store.list_patient_rows(db)
+        
+        for row in rows:
+            # IdJson and CalculationResults fields are extracted by SQLite;
+            # only report documents it could not parse.
+            if row["HasIdJson"] and not row["IdJsonValid"]:
+                logger.warning(f"Failed to parse IdJson for {row['StudyInstanceUID']}")
+            if row["HasCalculationResults"] and not row["CalculationResultsValid"]:
+                logger.warning(f"Failed to parse CalculationResults for {row['StudyInstanceUID']}")
+
+            # Case ID
+            # Format: FirstNameInitials_YYYYMMDD_AccessionNumber
+            # Using the CaseID if it exists, otherwise constructing it (which might not be perfect here)
+            # But since the pipeline creates the CaseID and it should match the folder structure
+            # We can try to extract from IdJson or use a fallback
+            case_id = row["CaseID"] or f"{row['PatientName'][:3]}_{row['StudyDate']}_{row['AccessionNumber']}"
+            filename = f"{case_id}.nii.gz"
+            case_folder = study_dir(case_id)
+
+            has_results = bool(row["ResultsKeyCount"])
+            hemorrhage_vol = row["HemorrhageVolCm3"]
+            body_regions = json.loads(row["BodyRegionsJson"]) if row["BodyRegionsJson"] else []
+
+            # Some legacy or interrupted runs wrote resultados.json to disk but did not
+            # persist CalculationResults back into SQLite. The dashboard should still
+            # expose those cases as having results.
+            if not has_results:
+                results_path = study_results_json(case_id)
+                if results_path.exists():
+                    try:
+                        with open(results_path, "r") as f:
+                            results = json.load(f)
+                    except Exception as e:
+                        logger.warning(f"Failed to read resultados.json for {case_id}: {e}")
+                    else:
+                        has_results = bool(results)
+                        hemorrhage_vol = results.get("hemorrhage_vol_cm3")
+                        body_regions = results.get("body_regions", [])
             
-            for row in rows:
-                metadata = {}
-                results = {}
-                
-                # Safely parse JSON blocks
+            # File size is recorded when segmentation finalizes the canonical
+            # NIfTI. Rows from before that (or re-prepared/purged since) fall
+            # back to a single stat() of the case's derived/ folder.
+            file_size = row["FileSizeBytes"]
+            if file_size is None:
+                nii_path = study_derived_dir(case_id) / filename
                 try:
-                    metadata = json.loads(row["IdJson"]) if row["IdJson"] else {}
-                except Exception as e:
-                    logger.warning(f"Failed to parse IdJson for {row['StudyInstanceUID']}: {e}")
+                    file_size = nii_path.stat().st_size
+                except OSError:
+                    file_size = 0
+            
+            # Elapsed time
+            elapsed_seconds = parse_elapsed_seconds(
+                row["SegmentationElapsedTime"]
+                or row["ProcessingElapsedTime"]
+                or row["PipelineElapsedTime"]
+                or ""
+            )
+            prepare_elapsed_seconds = parse_elapsed_seconds(row["PrepareElapsedTime"] or "")
 
-                try:
-                    results = json.loads(row["CalculationResults"]) if row["CalculationResults"] else {}
-                except Exception as e:
-                    logger.warning(f"Failed to parse CalculationResults for {row['StudyInstanceUID']}: {e}")
-
-                # Case ID
-                # Format: FirstNameInitials_YYYYMMDD_AccessionNumber
-                # Using the CaseID if it exists, otherwise constructing it (which might not be perfect here)
-                # But since the pipeline creates the CaseID and it should match the folder structure
-                # We can try to extract from IdJson or use a fallback
-                case_id = metadata.get("CaseID", f"{row['PatientName'][:3]}_{row['StudyDate']}_{row['AccessionNumber']}")
-                filename = f"{case_id}.nii.gz"
-                case_folder = study_dir(case_id)
-
-                # Some legacy or interrupted runs wrote resultados.json to disk but did not
-                # persist CalculationResults back into SQLite. The dashboard should still
-                # expose those cases as having results.
-                if not results:
-                    results_path = study_results_json(case_id)
-                    if results_path.exists():
-                        try:
-                            with open(results_path, "r") as f:
-                                results = json.load(f)
-                        except Exception as e:
-                            logger.warning(f"Failed to read resultados.json for {case_id}: {e}")
-                
-                # File size (We might still need to hit the disk for this if not in DB, 
-                # but it's a single stat() call instead of multiple file reads). 
-                # To be purely DB driven, file size should ideally live in DB, but for now we fallback to disk.
-                nii_path = study_derived_dir(case_id) / filename
-                file_size = nii_path.stat().st_size if nii_path.exists() else 0
-                
-                # Elapsed time
-                pipeline = metadata.get("Pipeline", {})
-                elapsed_seconds = parse_elapsed_seconds(
-                    pipeline.get("segmentation_elapsed_time")
-                    or pipeline.get("processing_elapsed_time")
-                    or pipeline.get("elapsed_time", "")
-                )
-                prepare_elapsed_seconds = parse_elapsed_seconds(pipeline.get("prepare_elapsed_time", ""))
-
-                hemorrhage_vol = results.get("hemorrhage_vol_cm3")
-                has_hemorrhage = isinstance(hemorrhage_vol, (int, float)) and hemorrhage_vol > 0.1
-                
-                patients.append({
-                    "case_id": case_id,
-                    "filename": filename,
-                    "file_size_bytes": file_size,
-                    "file_size_mb": round(file_size / (1024 * 1024), 2) if file_size else 0.0,
-                    "patient_name": normalize_patient_name_display(
-                        row["PatientName"] or metadata.get("PatientName", "Unknown"),
-                        settings.PATIENT_NAME_PROFILE,
-                    ),
-                    "patient_id": row["PatientID"] or metadata.get("PatientID", ""),
-                    "patient_birth_date": row["PatientBirthDate"] or metadata.get("PatientBirthDate", ""),
-                    "study_date": row["StudyDate"] or metadata.get("StudyDate", ""),
-                    "accession": row["AccessionNumber"] or metadata.get("AccessionNumber", ""),
-                    "modality": row["Modality"] or metadata.get("Modality", ""),
-                    "prepare_elapsed_seconds": prepare_elapsed_seconds,
-                    "elapsed_seconds": elapsed_seconds,
-                    "has_results": bool(results),
-                    "body_regions": results.get("body_regions", []),
-                    "has_hemorrhage": has_hemorrhage,
-                    "artifacts_purged": bool(row["ArtifactsPurged"]),
-                    "artifacts_purged_at": row["ArtifactsPurgedAt"],
-                })
-                
-            # Sort alphabetically by the displayed name (first part of case_id)
-            patients.sort(key=lambda x: x["case_id"].split('_')[0].lower())
+            has_hemorrhage = isinstance(hemorrhage_vol, (int, float)) and hemorrhage_vol > 0.1
             
-            return patients
-        except Exception as e:
-            logger.error(f"Error fetching patients from DB: {e}")
-            return []
+            patients.append({
+                "case_id": case_id,
+                "filename": filename,
+                "file_size_bytes": file_size,
+                "file_size_mb": round(file_size / (1024 * 1024), 2) if file_size else 0.0,
+                "patient_name": normalize_patient_name_display(
+                    row["PatientName"] or row["IdPatientName"] or "Unknown",
+                    settings.PATIENT_NAME_PROFILE,
+                ),
+                "patient_id": row["PatientID"] or row["IdPatientID"] or "",
+                "patient_birth_date": row["PatientBirthDate"] or row["IdPatientBirthDate"] or "",
+                "study_date": row["StudyDate"] or row["IdStudyDate"] or "",
+                "accession": row["AccessionNumber"] or row["IdAccessionNumber"] or "",
+                "modality": row["Modality"] or row["IdModality"] or "",
+                "prepare_elapsed_seconds": prepare_elapsed_seconds,
+                "elapsed_seconds": elapsed_seconds,
+                "has_results": has_results,
+                "body_regions": body_regions,
+                "has_hemorrhage": has_hemorrhage,
+                "artifacts_purged": bool(row["ArtifactsPurged"]),
+                "artifacts_purged_at": row["ArtifactsPurgedAt"],
+            })
+            
+        # Sort alphabetically by the displayed name (first part of case_id)
+        patients.sort(key=lambda x: x["case_id"].split('_')[0].lower())
+        return patients
 
     @staticmethod
     def get_patient_metadata(db: sqlite3.Connection, case_id: str):
-        # The CaseID is theoretically inside IdJson. 
-        # A Better way is searching by CaseID if we had it as a column.
-        # For now, we fetch all and filter or use JSON functions if SQLite version allows
+        # CaseID lives inside IdJson; the store exposes it as an indexed
+        # generated column so this is a single index lookup.
         row = store.find_case_row_by_case_id(db, case_id)
         if not row:
             return None
@@ -142,31 +179,51 @@ class PatientService:
 
     @staticmethod
     def update_biometrics(db: sqlite3.Connection, case_id: str, weight: float, height: float):
+        """Persist weight/height and return ``(metadata, changed)``.
+
+        Repeated PATCHes with the values already stored are acknowledged
+        without rewriting the IdJson blob.
+        """
         # Find StudyInstanceUID
         meta = PatientService.get_patient_metadata(db, case_id)
         if not meta:
-            return None
+            return None, False
         
         study_uid = meta.get("StudyInstanceUID")
         if not study_uid:
-            return None
+            return None, False
+
+        if meta.get("Weight") == weight and meta.get("Height") == height:
+            return meta, False
             
         meta["Weight"] = weight
         meta["Height"] = height
         
-        store.update_id_json(db, study_uid, meta)
-        return meta
+        # Patch the two keys in the stored blob instead of re-serializing it.
+        store.patch_id_json_biometrics(db, study_uid, weight=weight, height=height)
+        return meta, True
 
     @staticmethod
     def update_smi(db: sqlite3.Connection, case_id: str, smi: float):
+        """Persist the manual SMI and return ``(results, changed)``."""
         row = store.find_case_row_by_case_id(db, case_id)
         if not row:
-            return None
+            return None, False
         results = json.loads(row["CalculationResults"]) if row["CalculationResults"] else {}
+        if row["SMI"] == smi and results.get("SMI_cm2_m2") == round(smi, 2):
+            return results, False
         results["SMI_cm2_m2"] = round(smi, 2)
+        # Patch the stored blob in place instead of re-serializing it here.
         db.execute(
-            "UPDATE dicom_metadata SET SMI = ?, CalculationResults = ? WHERE StudyInstanceUID = ?",
-            (smi, json.dumps(results), row["StudyInstanceUID"]),
+            """
+            UPDATE dicom_metadata
+            SET SMI = ?,
+                CalculationResults = json_set(
+                    COALESCE(NULLIF(CalculationResults, ''), '{}'), '$.SMI_cm2_m2', ?
+                )
+            WHERE StudyInstanceUID = ?
+            """,
+            (smi, results["SMI_cm2_m2"], row["StudyInstanceUID"]),
         )
         db.commit()
-        return results
+        return results, True
@@ -25,8 +25,8 @@ async def download_uploader():
 async def dashboard():
     """Serve the dashboard shell or a simple fallback page."""
     index_path = settings.STATIC_DIR / "index.html"
-    if index_path.exists():
-        return HTMLResponse(content=index_path.read_text(encoding="utf-8"))
+    if index_path.is_file():
+        return FileResponse(path=index_path, media_type="text/html")
 
     return HTMLResponse(
         content="""
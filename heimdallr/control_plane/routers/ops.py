@@ -67,7 +67,7 @@ def _disk_summary() -> dict[str, Any]:
 
 
 @router.get("/queues")
-async def queue_capacity(db=Depends(get_db)):
+def queue_capacity(db=Depends(get_db)):
     """Return non-identifying queue and capacity data for external feeders."""
     queues = {name: _queue_summary(db, table) for name, table in QUEUE_TABLES.items()}
     segmentation = queues["segmentation"]
@@ -2,36 +2,133 @@
 
 from __future__ import annotations
 
-import io
 import json
 import os
+import stat
+import zipfile
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 from ...shared import store
 from ...shared.dependencies import get_db
 from ...shared.paths import study_artifacts_dir, study_derived_dir, study_dir, study_id_json, study_results_json
 from ...shared.schemas import BiometricData, PatientListResponse, SMIData
+from ...shared.spool import COPY_CHUNK_SIZE, atomic_write_text
 from ..case_pdf_report import build_case_report
 from ..patient_service import PatientService
 
 router = APIRouter(prefix="/api/patients", tags=["patients"])
 
 
+class _ZipChunkSink:
+    """Write-only, unseekable sink that hands zipfile output back in chunks."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# Members that are already compressed gain nothing from a second DEFLATE pass.
+_STORED_ZIP_SUFFIXES = (".gz", ".png", ".jpg", ".jpeg", ".zip")
+
+
+def _iter_folder_zip(folder_path: Path):
+    sink = _ZipChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                file_path = Path(root) / file
+                arcname = str(file_path.relative_to(folder_path))
+                zip_info = zipfile.ZipInfo.from_file(file_path, arcname)
+                zip_info.compress_type = (
+                    zipfile.ZIP_STORED if file.lower().endswith(_STORED_ZIP_SUFFIXES) else zipfile.ZIP_DEFLATED
+                )
+                with open(file_path, "rb") as source, zip_file.open(zip_info, "w") as target:
+                    while chunk := source.read(COPY_CHUNK_SIZE):
+                        target.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+                data = sink.drain()
+                if data:
+                    yield data
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def _regular_file_stat(path: Path) -> os.stat_result | None:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def _list_case_images(case_folder: Path) -> list[str]:
+    # os.walk is scandir-backed, so file/dir typing comes from readdir and
+    # no per-entry Path objects or stat calls are needed.
+    images = []
+    for root, _, files in os.walk(case_folder):
+        rel_root = os.path.relpath(root, case_folder)
+        for name in files:
+            if name.endswith(".png"):
+                images.append(name if rel_root == "." else os.path.join(rel_root, name))
+    images.sort()
+    return images
+
+
+def _if_none_match_hits(header: str | None, etag: str) -> bool:
+    """Apply the weak If-None-Match comparison to a list of entity tags or ``*``."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in header.split(","))
+
+
 @router.get("", response_model=PatientListResponse)
 async def list_patients(db=Depends(get_db)):
-    patients = PatientService.get_all_patients(db)
-    return {"patients": patients}
+    # The service hands back the already encoded PatientListResponse body and
+    # reuses it until dicom_metadata changes.
+    return Response(content=PatientService.get_patient_list_json(db), media_type="application/json")
 
 
 @router.get("/{case_id}/nifti")
-async def download_nifti(case_id: str):
+async def download_nifti(case_id: str, request: Request):
     nii_path = study_derived_dir(case_id) / f"{case_id}.nii.gz"
-    if not nii_path.exists():
+    nii_stat = _regular_file_stat(nii_path)
+    if nii_stat is None:
         raise HTTPException(status_code=404, detail="NIfTI file not found")
-    return FileResponse(path=nii_path, filename=f"{case_id}.nii.gz", media_type="application/gzip")
+    response = FileResponse(
+        path=nii_path,
+        filename=f"{case_id}.nii.gz",
+        media_type="application/gzip",
+        stat_result=nii_stat,
+        headers={"Cache-Control": "private, no-cache"},
+    )
+    # The NIfTI is rewritten when a case is reprocessed, so clients revalidate
+    # against the stat-derived ETag instead of caching it for a fixed time.
+    if _if_none_match_hits(request.headers.get("if-none-match"), response.headers["etag"]):
+        return Response(
+            status_code=304,
+            headers={"ETag": response.headers["etag"], "Cache-Control": "private, no-cache"},
+        )
+    return response
 
 
 @router.get("/{case_id}/report.pdf")
@@ -61,19 +158,8 @@ async def download_folder(case_id: str, folder_name: str):
     if not folder_path.exists() or not folder_path.is_dir():
         raise HTTPException(status_code=404, detail=f"Folder {folder_name} not found")
 
-    zip_buffer = io.BytesIO()
-    import zipfile
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(folder_path)
-                zip_file.write(file_path, arcname)
-
-    zip_buffer.seek(0)
-    return Response(
-        content=zip_buffer.getvalue(),
+    return StreamingResponse(
+        _iter_folder_zip(folder_path),
         media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={case_id}_{folder_name}.zip"},
     )
@@ -94,11 +180,7 @@ async def get_results(case_id: str, db=Depends(get_db)):
         else:
             raise HTTPException(status_code=404, detail="Results not found")
 
-        images = []
-        if case_folder.exists():
-            for img in case_folder.rglob("*.png"):
-                images.append(str(img.relative_to(case_folder)))
-        results["images"] = sorted(images)
+        results["images"] = _list_case_images(case_folder)
         if case_row:
             results["artifacts_purged"] = bool(case_row["ArtifactsPurged"])
             results["artifacts_purged_at"] = case_row["ArtifactsPurgedAt"]
@@ -109,7 +191,9 @@ async def get_results(case_id: str, db=Depends(get_db)):
                 triage_report = json.load(f)
             results["kidney_stone_triage_report"] = triage_report
 
-        return results
+        # The payload is already plain JSON data; returning a JSONResponse skips
+        # FastAPI's recursive jsonable_encoder pass over the whole metrics tree.
+        return JSONResponse(content=results)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Error reading results: {exc}") from exc
 
@@ -120,9 +204,10 @@ async def get_result_image(case_id: str, filename: str):
     image_path = (case_folder / filename).resolve()
     if case_folder not in image_path.parents:
         raise HTTPException(status_code=400, detail="Invalid image path")
-    if not image_path.exists():
+    image_stat = _regular_file_stat(image_path)
+    if image_stat is None:
         raise HTTPException(status_code=404, detail="Image not found")
-    return FileResponse(image_path)
+    return FileResponse(image_path, stat_result=image_stat)
 
 
 @router.get("/{case_id}/artifacts/{artifact_path:path}")
@@ -133,9 +218,10 @@ async def get_case_artifact(case_id: str, artifact_path: str):
 
     if case_root not in artifact.parents and artifact != case_root:
         raise HTTPException(status_code=400, detail="Invalid artifact path")
-    if not artifact.exists() or not artifact.is_file():
+    artifact_stat = _regular_file_stat(artifact)
+    if artifact_stat is None:
         raise HTTPException(status_code=404, detail="Artifact not found")
-    return FileResponse(artifact)
+    return FileResponse(artifact, stat_result=artifact_stat)
 
 
 @router.get("/{case_id}/metadata")
@@ -146,36 +232,30 @@ async def get_metadata(case_id: str, db=Depends(get_db)):
     return meta
 
 
+# The PATCH handlers are plain functions so FastAPI runs their SQLite commit and
+# JSON file rewrite in its threadpool instead of on the event loop.
 @router.patch("/{case_id}/biometrics")
-async def update_biometrics(case_id: str, data: BiometricData, db=Depends(get_db)):
-    meta = PatientService.update_biometrics(db, case_id, data.weight, data.height)
+def update_biometrics(case_id: str, data: BiometricData, db=Depends(get_db)):
+    meta, changed = PatientService.update_biometrics(db, case_id, data.weight, data.height)
     if not meta:
         raise HTTPException(status_code=404, detail="Patient not found or could not update")
 
     id_json_path = study_id_json(case_id)
-    if id_json_path.exists():
-        with open(id_json_path, "w") as f:
-            json.dump(meta, f, indent=2)
+    if changed and id_json_path.exists():
+        atomic_write_text(id_json_path, json.dumps(meta, indent=2))
 
-    bmi = data.weight / (data.height**2)
-    return {
-        "status": "success",
-        "weight": data.weight,
-        "height": data.height,
-        "bmi": round(bmi, 2),
-    }
+    return {"status": "success", **data.model_dump()}
 
 
 @router.patch("/{case_id}/smi")
-async def update_smi(case_id: str, data: SMIData, db=Depends(get_db)):
-    results = PatientService.update_smi(db, case_id, data.smi)
+def update_smi(case_id: str, data: SMIData, db=Depends(get_db)):
+    results, changed = PatientService.update_smi(db, case_id, data.smi)
     if not results:
         raise HTTPException(status_code=404, detail="Patient or results not found")
 
     results_json_path = study_results_json(case_id)
-    if results_json_path.exists():
-        with open(results_json_path, "w") as f:
-            json.dump(results, f, indent=2)
+    if changed and results_json_path.exists():
+        atomic_write_text(results_json_path, json.dumps(results, indent=2))
 
     return {
         "status": "success",
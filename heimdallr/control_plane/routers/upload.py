@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from ...shared import settings
 from ...integration.status import external_job_status
@@ -56,7 +57,7 @@ async def upload_file(
 
     requested_qc_evidence = _strict_optional_bool(qc_evidence, field_name="qc_evidence")
     try:
-        atomic_copy_stream(file_path, file.file)
+        await run_in_threadpool(atomic_copy_stream, file_path, file.file)
         qc_resolution = resolve_qc_evidence(
             requested_qc_evidence,
             host_enabled=settings.QC_EVIDENCE_ENABLED,
@@ -180,7 +181,7 @@ async def submit_job(
     )
 
     try:
-        atomic_copy_stream(file_path, study_file.file)
+        await run_in_threadpool(atomic_copy_stream, file_path, study_file.file)
         write_external_submission_sidecar(file_path, submission_payload)
     except Exception as exc:
         if file_path.exists():
@@ -33,7 +33,6 @@ from __future__ import annotations
 
 import argparse
 import datetime
-import io
 import json
 import os
 import shutil
@@ -51,7 +50,8 @@ from pynetdicom import AE, ALL_TRANSFER_SYNTAXES, AllStoragePresentationContexts
 from pynetdicom.sop_class import Verification
 
 from heimdallr.shared import settings, store
-from heimdallr.shared.spool import atomic_write_bytes
+from heimdallr.shared.http_session import new_http_session
+from heimdallr.shared.spool import temporary_spool_path
 from heimdallr.shared.study_manifest import build_study_manifest_digest
 from heimdallr.shared.sqlite import connect as db_connect
 
@@ -59,6 +59,7 @@ settings.configure_service_stdio()
 
 LOCAL_TZ = ZoneInfo(settings.TIMEZONE)
 INTAKE_MANIFEST_NAME = "_heimdallr_intake.json"
+_HTTP_SESSION = new_http_session()
 
 
 @dataclass
@@ -200,18 +201,21 @@ def build_intake_manifest(
     }
 
 
-def zip_study(study_dir: Path, *, intake_manifest: dict | None = None) -> bytes:
+def zip_study(study_dir: Path, archive_path: Path, *, intake_manifest: dict | None = None) -> Path:
     """
     Create ZIP archive of entire study directory.
     
+    The archive is written straight to disk so the study payload is never
+    buffered in memory.
+    
     Args:
         study_dir: Directory containing DICOM files (organized by series)
+        archive_path: Destination path for the ZIP archive
     
     Returns:
-        ZIP file contents as bytes
+        Path to the written ZIP archive
     """
-    buff = io.BytesIO()
-    with zipfile.ZipFile(buff, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for root, _, files in os.walk(study_dir):
             for fn in files:
                 # Skip macOS metadata files
@@ -223,16 +227,15 @@ def zip_study(study_dir: Path, *, intake_manifest: dict | None = None) -> bytes:
                 zf.write(fpath, arcname=str(rel))
         if intake_manifest:
             zf.writestr(INTAKE_MANIFEST_NAME, json.dumps(intake_manifest, indent=2))
-    buff.seek(0)
-    return buff.read()
+    return archive_path
 
 
-def upload_zip(zip_bytes: bytes, upload_url: str, token: Optional[str], timeout: int) -> requests.Response:
+def upload_zip(zip_path: Path, upload_url: str, token: Optional[str], timeout: int) -> requests.Response:
     """
     Upload ZIP file to Heimdallr server.
     
     Args:
-        zip_bytes: ZIP file contents
+        zip_path: Path to the ZIP archive on disk
         upload_url: Server upload endpoint
         token: Optional bearer token for authentication
         timeout: Request timeout in seconds
@@ -244,10 +247,11 @@ def upload_zip(zip_bytes: bytes, upload_url: str, token: Optional[str], timeout:
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    files = {
-        "file": ("study.zip", zip_bytes, "application/zip")
-    }
-    return requests.post(upload_url, headers=headers, files=files, timeout=timeout)
+    with open(zip_path, "rb") as zip_handle:
+        files = {
+            "file": ("study.zip", zip_handle, "application/zip")
+        }
+        return _HTTP_SESSION.post(upload_url, headers=headers, files=files, timeout=timeout)
 
 
 class HeimdallrDicomListener:
@@ -436,6 +440,7 @@ class HeimdallrDicomListener:
 
             # Study is idle: process and upload
             st.locked = True
+            work_zip: Optional[Path] = None
             try:
                 handoff_ts = now()
                 manifest_digest = build_study_manifest_digest(
@@ -449,8 +454,10 @@ class HeimdallrDicomListener:
                     handoff_ts=handoff_ts,
                     manifest_digest=manifest_digest,
                 )
-                # Create ZIP archive
-                zip_bytes = zip_study(st.path, intake_manifest=intake_manifest)
+                # Create ZIP archive once under a hidden spool name; handoff
+                # and failure archiving below only rename it.
+                work_zip = temporary_spool_path(self.upload_staging_dir / f"{study_uid}.zip")
+                zip_study(st.path, work_zip, intake_manifest=intake_manifest)
 
                 # Attempt handoff with retries
                 ok = False
@@ -481,12 +488,12 @@ class HeimdallrDicomListener:
                                 break
                             staged_name = f"study_{settings.local_timestamp('%Y%m%d%H%M%S')}_{study_uid}.zip"
                             staged_zip = self.upload_staging_dir / staged_name
-                            atomic_write_bytes(staged_zip, zip_bytes)
+                            work_zip.replace(staged_zip)
                             ok = True
                             break
                         else:
                             resp = upload_zip(
-                                zip_bytes,
+                                work_zip,
                                 self.upload_url,
                                 self.upload_token,
                                 self.upload_timeout
@@ -521,7 +528,7 @@ class HeimdallrDicomListener:
                 else:
                     # Upload failed: save a disposable ZIP snapshot for review
                     fail_path = self.failed_dir / zip_name
-                    fail_path.write_bytes(zip_bytes)
+                    shutil.move(str(work_zip), str(fail_path))
                     
                     # Remove from active studies (keep raw DICOM for investigation)
                     self.studies.pop(study_uid, None)
@@ -531,6 +538,8 @@ class HeimdallrDicomListener:
                         print(f"  Last error: {last_exc}")
                         
             finally:
+                if work_zip is not None:
+                    work_zip.unlink(missing_ok=True)
                 st.locked = False
 
 
@@ -18,12 +18,14 @@ from heimdallr.integration.delivery.config import (
 )
 from heimdallr.integration.delivery.package import build_delivery_package, build_failed_delivery_manifest
 from heimdallr.shared import settings, store
+from heimdallr.shared.http_session import new_http_session
 from heimdallr.shared.sqlite import connect as db_connect
 
 settings.configure_service_stdio()
 
 SERVICE_NAME = "integration_delivery"
 MODULE_NAME = "integration.delivery.worker"
+_HTTP_SESSION = new_http_session()
 
 
 def _log_event(
@@ -118,7 +120,7 @@ def deliver_case_package(
         raise RuntimeError(f"Unsupported delivery method: {http_method}")
 
     with open(package_path, "rb") as package_handle:
-        response = requests.request(
+        response = _HTTP_SESSION.request(
             "POST",
             callback_url,
             files={
@@ -153,7 +155,7 @@ def deliver_callback(
         )
     if str(http_method).upper() != "POST":
         raise RuntimeError(f"Unsupported delivery method: {http_method}")
-    response = requests.request(
+    response = _HTTP_SESSION.request(
         "POST",
         callback_url,
         files={
@@ -15,12 +15,14 @@ from heimdallr.integration.dispatch.config import (
     load_integration_dispatch_config,
 )
 from heimdallr.shared import settings, store
+from heimdallr.shared.http_session import new_http_session
 from heimdallr.shared.sqlite import connect as db_connect
 
 settings.configure_service_stdio()
 
 SERVICE_NAME = "integration_dispatch"
 MODULE_NAME = "integration.dispatch.worker"
+_HTTP_SESSION = new_http_session()
 
 
 def _log_event(
@@ -116,11 +118,14 @@ def dispatch_integration_event(
     payload_json: str,
 ) -> requests.Response:
     headers = json.loads(request_headers_json) if request_headers_json else {}
-    payload = json.loads(payload_json)
-    response = requests.request(
+    # The queue already stores the serialized event body; send it as-is
+    # instead of decoding it only for requests to encode it again.
+    if not any(str(name).lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    response = _HTTP_SESSION.request(
         http_method,
         destination_url,
-        json=payload,
+        data=payload_json.encode("utf-8"),
         headers=headers,
         timeout=max(int(timeout_seconds), 1),
     )
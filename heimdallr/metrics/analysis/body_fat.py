@@ -75,7 +75,7 @@ def compute_axial_mask_extent(mask: np.ndarray) -> tuple[int, int] | None:
     if mask_bool.ndim != 3 or not np.any(mask_bool):
         return None
 
-    z_indices = np.where(mask_bool.sum(axis=(0, 1)) > 0)[0]
+    z_indices = np.flatnonzero(mask_bool.any(axis=(0, 1)))
     if z_indices.size == 0:
         return None
     return int(z_indices[0]), int(z_indices[-1])
@@ -195,7 +195,7 @@ def _volume_for_slices(mask: np.ndarray, start: int, end: int, spacing_mm: Seque
     if mask_bool.ndim != 3:
         return 0, 0.0
     clipped = mask_bool[:, :, start : end + 1]
-    voxel_count = int(clipped.sum())
+    voxel_count = int(np.count_nonzero(clipped))
     return voxel_count, round(voxel_count * _voxel_volume_cm3(spacing_mm), 3)
 
 
@@ -299,10 +299,11 @@ def calculate_mask_hu_statistics(ct: np.ndarray, mask: np.ndarray) -> dict[str,
     if voxel_count == 0:
         return {"voxel_count": 0, "mean_hu": None, "std_hu": None}
 
+    mean_hu = np.mean(voxels)
     return {
         "voxel_count": voxel_count,
-        "mean_hu": round(float(np.mean(voxels)), 2),
-        "std_hu": round(float(np.std(voxels)), 2),
+        "mean_hu": round(float(mean_hu), 2),
+        "std_hu": round(float(np.std(voxels, mean=mean_hu)), 2),
     }
 
 
@@ -366,15 +367,16 @@ def _keep_largest_component_2d(mask_2d: np.ndarray) -> np.ndarray:
         return mask_bool
 
     full_com = center_of_mass(mask_bool)
+    component_ids = range(1, num_features + 1)
+    component_areas = np.bincount(labeled.ravel(), minlength=num_features + 1)
+    component_coms = center_of_mass(mask_bool, labeled, component_ids)
     best_label = 1
     best_key = (-1, float("inf"))
 
-    for component_id in range(1, num_features + 1):
-        component = labeled == component_id
-        area = int(component.sum())
+    for component_id, component_com in zip(component_ids, component_coms):
+        area = int(component_areas[component_id])
         if area == 0:
             continue
-        component_com = center_of_mass(component)
         distance = float(np.linalg.norm(np.asarray(component_com) - np.asarray(full_com)))
         key = (area, -distance)
         if key > best_key:
@@ -393,7 +395,7 @@ def _keep_largest_component_3d(mask_3d: np.ndarray) -> np.ndarray:
     if num_features <= 1:
         return mask_bool
 
-    component_sizes = [int(np.sum(labeled == component_id)) for component_id in range(1, num_features + 1)]
+    component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)[1:]
     best_label = int(np.argmax(component_sizes)) + 1
     return labeled == best_label
 
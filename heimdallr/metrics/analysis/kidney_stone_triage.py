@@ -141,20 +141,24 @@ def _render_component_overlays(
         "axial_slice": axial_slice,
         "coronal_slice": coronal_slice,
     }
-    for plane, ct_plane, kidney_plane, component_plane, title in views:
-        out_path = output_prefix.parent / f"{output_prefix.name}_{plane}.png"
-        fig, ax = plt.subplots(figsize=(7, 7), dpi=180)
-        ax.imshow(ct_plane, cmap="gray", vmin=vmin, vmax=vmax, origin="lower")
-        ax.contour(kidney_plane.astype(float), levels=[0.5], colors=["deepskyblue"], linewidths=1.0)
-        masked = np.ma.masked_where(~component_plane, component_plane)
-        ax.imshow(masked, cmap="autumn", alpha=0.8, origin="lower", interpolation="none")
-        ax.contour(component_plane.astype(float), levels=[0.5], colors=["yellow"], linewidths=1.2)
-        ax.set_title(title)
-        ax.axis("off")
-        fig.tight_layout(pad=0)
-        fig.savefig(out_path, bbox_inches="tight", pad_inches=0)
+    # Both planes share one figure; clearing the axes is much cheaper than a new figure.
+    fig, ax = plt.subplots(figsize=(7, 7), dpi=180)
+    try:
+        for plane, ct_plane, kidney_plane, component_plane, title in views:
+            out_path = output_prefix.parent / f"{output_prefix.name}_{plane}.png"
+            ax.clear()
+            ax.imshow(ct_plane, cmap="gray", vmin=vmin, vmax=vmax, origin="lower")
+            ax.contour(kidney_plane.astype(float), levels=[0.5], colors=["deepskyblue"], linewidths=1.0)
+            masked = np.ma.masked_where(~component_plane, component_plane)
+            ax.imshow(masked, cmap="autumn", alpha=0.8, origin="lower", interpolation="none")
+            ax.contour(component_plane.astype(float), levels=[0.5], colors=["yellow"], linewidths=1.2)
+            ax.set_title(title)
+            ax.axis("off")
+            fig.tight_layout(pad=0)
+            fig.savefig(out_path, bbox_inches="tight", pad_inches=0)
+            paths[f"{plane}_overlay_png"] = str(out_path)
+    finally:
         plt.close(fig)
-        paths[f"{plane}_overlay_png"] = str(out_path)
     return paths
 
 
@@ -192,16 +196,16 @@ def analyze_kidneys(
 
         mask_img = _load_nifti(mask_path)
         _assert_same_geometry(ct_img, mask_img, mask_name)
-        kidney_mask = mask_img.get_fdata() > 0.5
+        kidney_mask = np.asanyarray(mask_img.dataobj) > 0.5
         kidney_values = ct[kidney_mask]
         dense_mask = kidney_mask & (ct > threshold_hu)
         labels, num_components = ndimage.label(dense_mask, structure=structure)
         mins, maxs = _crop_bounds(kidney_mask, margin_xyz=(20, 20, 10))
 
         components: list[dict[str, Any]] = []
+        component_sizes = np.bincount(labels.ravel(), minlength=num_components + 1)
         for label in range(1, num_components + 1):
-            component_mask = labels == label
-            voxel_count = int(component_mask.sum())
+            voxel_count = int(component_sizes[label])
             if voxel_count == 0:
                 continue
 
@@ -211,6 +215,7 @@ def analyze_kidneys(
             if not (passes_voxel_filter or passes_volume_filter):
                 continue
 
+            component_mask = labels == label
             component_values = ct[component_mask]
             coords_ijk = np.argwhere(component_mask)
             coords_xyz = nib.affines.apply_affine(ct_img.affine, coords_ijk)
@@ -253,13 +258,14 @@ def analyze_kidneys(
         total_stone_volume_mm3 += sum(item["volume_mm3"] for item in components)
         stone_voxel_count = sum(item["voxel_count"] for item in components)
         stone_volume_mm3 = sum(item["volume_mm3"] for item in components)
+        kidney_voxel_count = int(np.count_nonzero(kidney_mask))
 
         kidneys.append(
             {
                 "mask_name": mask_name,
                 "mask_path": str(mask_path),
-                "kidney_voxel_count": int(kidney_mask.sum()),
-                "kidney_volume_ml": float(kidney_mask.sum() * voxel_volume_mm3 / 1000.0),
+                "kidney_voxel_count": kidney_voxel_count,
+                "kidney_volume_ml": float(kidney_voxel_count * voxel_volume_mm3 / 1000.0),
                 "kidney_hu_mean": float(kidney_values.mean()) if kidney_values.size else None,
                 "kidney_hu_max": float(kidney_values.max()) if kidney_values.size else None,
                 "stone_voxel_count": stone_voxel_count,
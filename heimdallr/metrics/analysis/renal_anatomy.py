@@ -149,8 +149,12 @@ def _extract_components(
             hu_std = None
         else:
             hu_values = np.asarray(ct_data)[component_mask]
-            hu_mean = round(float(np.mean(hu_values)), 2) if hu_values.size else None
-            hu_std = round(float(np.std(hu_values)), 2) if hu_values.size else None
+            hu_mean = None
+            hu_std = None
+            if hu_values.size:
+                mean_value = np.mean(hu_values)
+                hu_mean = round(float(mean_value), 2)
+                hu_std = round(float(np.std(hu_values, mean=mean_value)), 2)
         complete = _mask_complete(component_mask)
         extracted.append(
             {
@@ -166,7 +166,7 @@ def _canonical_mask_world_points(
     max_points: int = 250_000,
 ) -> tuple[np.ndarray, tuple[int, int, int]]:
     mask_image = nib.as_closest_canonical(nib.load(str(mask_path)))
-    mask = np.asarray(mask_image.get_fdata(), dtype=np.float32) > 0
+    mask = np.asanyarray(mask_image.dataobj) > 0
     coords = np.argwhere(mask)
     if coords.size == 0:
         raise RuntimeError("brain mask is empty")
@@ -186,7 +186,7 @@ def _optional_canonical_mask_world_points(
     if not mask_path.exists():
         return None
     mask_image = nib.as_closest_canonical(nib.load(str(mask_path)))
-    mask = np.asarray(mask_image.get_fdata(), dtype=np.float32) > 0
+    mask = np.asanyarray(mask_image.dataobj) > 0
     coords = np.argwhere(mask)
     if coords.shape[0] < 10:
         return None
@@ -383,46 +383,46 @@ def collect_mask_statuses(
 
     for mask_name in mask_names:
         mask_path = mask_dir / f"{mask_name}.nii.gz"
-        if not mask_path.exists():
+        # nibabel stats the path itself; a separate exists() probe is redundant.
+        try:
+            image = nib.load(str(mask_path))
+            mask = np.asanyarray(image.dataobj) > 0
+        except FileNotFoundError:
             status = compute_mask_status(None, spacing_xyz)
             missing.append(mask_name)
+        except Exception as exc:
+            status = {
+                "status": "read_error",
+                "present": False,
+                "complete": False,
+                "voxel_count": 0,
+                "volume_cm3": None,
+                "bounds": None,
+                "touches_scan_bounds": True,
+                "touched_bounds": ["read_error"],
+                "error": str(exc),
+            }
+            invalid_geometry.append(mask_name)
         else:
-            try:
-                image = nib.load(str(mask_path))
-                mask = np.asarray(image.get_fdata(), dtype=np.float32) > 0
-            except Exception as exc:
+            if reference_shape is not None and tuple(mask.shape) != tuple(reference_shape):
                 status = {
-                    "status": "read_error",
+                    "status": "geometry_mismatch",
                     "present": False,
                     "complete": False,
-                    "voxel_count": 0,
+                    "voxel_count": int(np.count_nonzero(mask)),
                     "volume_cm3": None,
                     "bounds": None,
                     "touches_scan_bounds": True,
-                    "touched_bounds": ["read_error"],
-                    "error": str(exc),
+                    "touched_bounds": ["geometry_mismatch"],
+                    "shape": [int(value) for value in mask.shape],
                 }
                 invalid_geometry.append(mask_name)
             else:
-                if reference_shape is not None and tuple(mask.shape) != tuple(reference_shape):
-                    status = {
-                        "status": "geometry_mismatch",
-                        "present": False,
-                        "complete": False,
-                        "voxel_count": int(np.count_nonzero(mask)),
-                        "volume_cm3": None,
-                        "bounds": None,
-                        "touches_scan_bounds": True,
-                        "touched_bounds": ["geometry_mismatch"],
-                        "shape": [int(value) for value in mask.shape],
-                    }
-                    invalid_geometry.append(mask_name)
-                else:
-                    status = compute_mask_status(mask, spacing_xyz)
-                    if status["status"] == "empty":
-                        empty.append(mask_name)
-                    elif not status["complete"]:
-                        incomplete.append(mask_name)
+                status = compute_mask_status(mask, spacing_xyz)
+                if status["status"] == "empty":
+                    empty.append(mask_name)
+                elif not status["complete"]:
+                    incomplete.append(mask_name)
         statuses[mask_name] = status
 
     return {
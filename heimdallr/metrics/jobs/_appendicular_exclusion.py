@@ -59,11 +59,12 @@ def load_upper_appendicular_mask_slice(
         if not mask_path.exists():
             continue
         mask_img = nib.load(str(mask_path))
-        mask_data = np.asarray(mask_img.get_fdata()) > 0
-        if mask_data.shape != reference_shape:
+        if tuple(mask_img.shape) != tuple(reference_shape):
             skipped_masks[mask_name] = "shape_mismatch"
             continue
-        exclusion_slice |= np.any(mask_data[:, :, slice_start:slice_end], axis=2)
+        # Only the projection window is needed; slice the proxy instead of the full volume.
+        mask_slab = np.asanyarray(mask_img.dataobj[:, :, slice_start:slice_end]) > 0
+        exclusion_slice |= np.any(mask_slab, axis=2)
         loaded_masks.append(mask_name)
 
     audit: dict[str, Any] = {
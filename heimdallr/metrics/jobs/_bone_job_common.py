@@ -99,12 +99,12 @@ def resolve_canonical_nifti(case_id: str) -> Path | None:
 
 def load_nifti_mask(mask_path: Path) -> tuple[nib.Nifti1Image, np.ndarray]:
     image = nib.load(str(mask_path))
-    return image, np.asarray(image.get_fdata(), dtype=np.float32) > 0
+    return image, np.asanyarray(image.dataobj) > 0
 
 
 def load_ct_volume(ct_path: Path) -> tuple[nib.Nifti1Image, np.ndarray]:
     image = nib.load(str(ct_path))
-    return image, np.asarray(image.get_fdata(), dtype=np.float32)
+    return image, image.get_fdata(dtype=np.float32)
 
 
 def affine_axis_codes(affine: np.ndarray) -> tuple[str, str, str]:
@@ -247,7 +247,7 @@ def mask_complete(mask: np.ndarray) -> bool:
 
 
 def center_slice_index(mask: np.ndarray) -> int | None:
-    z_indices = np.where(np.asarray(mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    z_indices = np.flatnonzero(np.asarray(mask, dtype=bool).any(axis=(0, 1)))
     if len(z_indices) == 0:
         return None
     return int(z_indices[len(z_indices) // 2])
@@ -264,7 +264,7 @@ def _keep_largest_component_3d(mask: np.ndarray) -> np.ndarray:
     if num_features <= 1:
         return mask_bool
 
-    component_sizes = [int(np.sum(labeled == component_id)) for component_id in range(1, num_features + 1)]
+    component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)[1:]
     best_label = int(np.argmax(component_sizes)) + 1
     return labeled == best_label
 
@@ -389,7 +389,7 @@ def sagittal_plane_spacing_mm(
 
 
 def build_l1_axial_roi(mask_l1: np.ndarray, spacing_mm: tuple[float, float, float]) -> tuple[np.ndarray | None, dict[str, Any]]:
-    from scipy.ndimage import binary_erosion, center_of_mass, label as ndlabel
+    from scipy.ndimage import binary_erosion, label as ndlabel
 
     center_z = center_slice_index(mask_l1)
     if center_z is None:
@@ -402,15 +402,15 @@ def build_l1_axial_roi(mask_l1: np.ndarray, spacing_mm: tuple[float, float, floa
 
     labeled, num_features = ndlabel(eroded_2d)
     if num_features > 1:
-        component_sizes = [np.sum(labeled == i) for i in range(1, num_features + 1)]
+        component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)[1:]
         largest = int(np.argmax(component_sizes)) + 1
         eroded_2d = labeled == largest
 
     if not np.any(eroded_2d):
         return None, {"status": "empty_eroded_mask", "slice_index": center_z}
 
-    full_com_x, full_com_y = center_of_mass(mask_2d)
-    body_com_x, body_com_y = center_of_mass(eroded_2d)
+    full_com_x, full_com_y = _plane_centroid(mask_2d)
+    body_com_x, body_com_y = _plane_centroid(eroded_2d)
 
     x_indices, y_indices = np.where(eroded_2d)
     x_min, x_max = int(x_indices.min()), int(x_indices.max())
@@ -445,6 +445,11 @@ def build_l1_axial_roi(mask_l1: np.ndarray, spacing_mm: tuple[float, float, floa
     }
 
 
+def _plane_centroid(mask_2d: np.ndarray) -> tuple[float, float]:
+    rows, cols = np.nonzero(mask_2d)
+    return float(rows.mean()), float(cols.mean())
+
+
 def build_l1_sagittal_roi(
     mask_l1: np.ndarray,
     spacing_mm: tuple[float, float, float],
@@ -118,7 +118,7 @@ def create_derived_ct_series_from_nifti(
 ) -> list[Path]:
     """Write a derived axial CT DICOM series from a normalized NIfTI volume."""
     image = nib.load(str(nifti_path))
-    data = np.asarray(image.get_fdata(), dtype=np.float32)
+    data = image.get_fdata(dtype=np.float32)
     if data.ndim != 3:
         raise RuntimeError(f"Expected 3D NIfTI volume. Got shape {data.shape}")
 
@@ -90,7 +90,7 @@ def _compute_brain_measurement(
         }
 
     mask_bool = np.asarray(brain_mask, dtype=bool)
-    voxel_count = int(mask_bool.sum())
+    voxel_count = int(np.count_nonzero(mask_bool))
     if voxel_count == 0:
         return {
             "analysis_status": "empty",
@@ -103,7 +103,7 @@ def _compute_brain_measurement(
     complete = mask_complete(mask_bool)
     voxel_volume_cm3 = float(spacing_xyz[0] * spacing_xyz[1] * spacing_xyz[2]) / 1000.0
     observed_volume_cm3 = round(voxel_count * voxel_volume_cm3, 3) if complete else None
-    occupied_indices = np.where(mask_bool.sum(axis=(0, 1)) > 0)[0]
+    occupied_indices = np.flatnonzero(mask_bool.any(axis=(0, 1)))
     axial_slice_extent = None
     if occupied_indices.size > 0:
         axial_slice_extent = {
@@ -174,7 +174,7 @@ def _build_export_slabs(
     spacing_z: float,
     slab_thickness_mm: float,
 ) -> list[dict[str, Any]]:
-    occupied_indices = np.where(np.asarray(union_mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    occupied_indices = np.flatnonzero(np.asarray(union_mask, dtype=bool).any(axis=(0, 1)))
     if occupied_indices.size == 0:
         return []
 
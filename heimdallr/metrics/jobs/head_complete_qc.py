@@ -26,7 +26,6 @@ from heimdallr.metrics.head import (
     parse_normalization_spec,
 )
 from heimdallr.metrics.jobs._bone_job_common import (
-    load_ct_volume,
     load_job_config,
     read_json,
     reorient_display_array,
@@ -94,9 +93,14 @@ def _clear_metric_outputs(metric_dir: Path) -> None:
             child.unlink()
 
 
-def _load_mask(mask_path: Path) -> np.ndarray:
+def _load_mask(mask_path: Path, mask_cache: dict[Path, np.ndarray] | None = None) -> np.ndarray:
+    if mask_cache is not None and mask_path in mask_cache:
+        return mask_cache[mask_path]
     image = nib.load(str(mask_path))
-    return np.asarray(image.get_fdata(), dtype=np.float32) > 0
+    mask = np.asanyarray(image.dataobj) > 0
+    if mask_cache is not None:
+        mask_cache[mask_path] = mask
+    return mask
 
 
 def _load_case_metadata(case_id: str, case_dir: Path) -> dict[str, Any]:
@@ -189,7 +193,7 @@ def _indices_for_slab(source_positions_mm: np.ndarray, center_mm: float, slab_mm
 
 
 def _build_slabs(mask: np.ndarray, *, spacing_z: float, slab_mm: float) -> list[dict[str, Any]]:
-    occupied = np.where(np.asarray(mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    occupied = np.flatnonzero(np.asarray(mask, dtype=bool).any(axis=(0, 1)))
     if occupied.size == 0:
         return []
     positions = _source_positions_mm(mask.shape[2], spacing_z)
@@ -209,7 +213,7 @@ def _build_slabs(mask: np.ndarray, *, spacing_z: float, slab_mm: float) -> list[
 
 
 def _build_bleed_slabs(mask: np.ndarray, *, spacing_z: float, slab_mm: float) -> list[dict[str, Any]]:
-    occupied = np.where(np.asarray(mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    occupied = np.flatnonzero(np.asarray(mask, dtype=bool).any(axis=(0, 1)))
     if occupied.size == 0:
         return []
     positions = _source_positions_mm(mask.shape[2], spacing_z)
@@ -242,7 +246,7 @@ def _mask_slab(mask: np.ndarray, source_indices: list[int]) -> np.ndarray:
 
 def _load_volume_data(image_path: Path) -> tuple[nib.Nifti1Image, np.ndarray]:
     image = nib.load(str(image_path))
-    data = np.asarray(image.get_fdata(), dtype=np.float32)
+    data = image.get_fdata(dtype=np.float32)
     if data.ndim != 3:
         raise RuntimeError(f"Expected 3D NIfTI volume. Got shape {data.shape}")
     return image, data
@@ -255,7 +259,7 @@ def _resample_mask_to_reference(mask_path: Path, reference_image: nib.Nifti1Imag
         (reference_image.shape[:3], reference_image.affine),
         order=0,
     )
-    return np.asarray(resampled.get_fdata(), dtype=np.float32) > 0.5
+    return np.asanyarray(resampled.dataobj) > 0.5
 
 
 def _render_structures_overlay_on_normalized_geometry(
@@ -501,6 +505,8 @@ def _bleed_mask_status(
     mask_path: Path,
     spacing_xyz: tuple[float, float, float],
     reference_shape: tuple[int, int, int],
+    *,
+    mask_cache: dict[Path, np.ndarray] | None = None,
 ) -> dict[str, Any]:
     if not mask_path.exists():
         status = compute_mask_status(None, spacing_xyz)
@@ -509,7 +515,7 @@ def _bleed_mask_status(
         return status
 
     try:
-        mask = _load_mask(mask_path)
+        mask = _load_mask(mask_path, mask_cache)
     except Exception as exc:
         return {
             "status": "read_error",
@@ -553,6 +559,8 @@ def _head_union_status(
     component_summary: dict[str, Any],
     spacing_xyz: tuple[float, float, float],
     reference_shape: tuple[int, int, int],
+    *,
+    mask_cache: dict[Path, np.ndarray] | None = None,
 ) -> dict[str, Any]:
     masks: list[np.ndarray] = []
     for mask_name in HEAD_COMPONENT_MASKS:
@@ -561,7 +569,7 @@ def _head_union_status(
             continue
         mask_path = total_dir / f"{mask_name}.nii.gz"
         try:
-            mask = _load_mask(mask_path)
+            mask = _load_mask(mask_path, mask_cache)
         except Exception:
             continue
         if tuple(mask.shape) == tuple(reference_shape):
@@ -576,11 +584,15 @@ def _head_union_status(
     return compute_mask_status(union, spacing_xyz)
 
 
-def _load_support_mask(mask_path: Path, reference_shape: tuple[int, int, int]) -> np.ndarray | None:
+def _load_support_mask(
+    mask_path: Path,
+    reference_shape: tuple[int, int, int],
+    mask_cache: dict[Path, np.ndarray] | None = None,
+) -> np.ndarray | None:
     if not mask_path.exists():
         return None
     try:
-        mask = _load_mask(mask_path)
+        mask = _load_mask(mask_path, mask_cache)
     except Exception:
         return None
     if tuple(mask.shape) != tuple(reference_shape):
@@ -594,6 +606,7 @@ def _bleed_anatomic_support_qc(
     total_dir: Path,
     reference_shape: tuple[int, int, int],
     dilation_iterations: int = 2,
+    mask_cache: dict[Path, np.ndarray] | None = None,
 ) -> dict[str, Any]:
     if bleed_mask is None or not np.asarray(bleed_mask, dtype=bool).any():
         return {
@@ -607,7 +620,7 @@ def _bleed_anatomic_support_qc(
     source_masks: list[str] = []
     support = np.zeros(reference_shape, dtype=bool)
     for mask_name in ("skull", "brain"):
-        mask = _load_support_mask(total_dir / f"{mask_name}.nii.gz", reference_shape)
+        mask = _load_support_mask(total_dir / f"{mask_name}.nii.gz", reference_shape, mask_cache)
         if mask is None:
             continue
         support |= mask
@@ -696,7 +709,8 @@ def main() -> int:
             print(json.dumps(payload, indent=2))
             return 0
 
-        ct_img, _ = load_ct_volume(ct_path)
+        # Only the CT geometry is needed here; the normalizers read voxel data themselves.
+        ct_img = nib.load(str(ct_path))
         case_metadata = _load_case_metadata(args.case_id, case_dir)
         artifact_locale = _artifact_locale(job_config)
         spacing_xyz = tuple(float(value) for value in ct_img.header.get_zooms()[:3])
@@ -707,7 +721,15 @@ def main() -> int:
             spacing_xyz,
             reference_shape=reference_shape,
         )
-        head_union = _head_union_status(total_dir, head_components, spacing_xyz, reference_shape)
+        # Brain, skull, and bleed masks feed several QC passes below; decompress each once.
+        mask_cache: dict[Path, np.ndarray] = {}
+        head_union = _head_union_status(
+            total_dir,
+            head_components,
+            spacing_xyz,
+            reference_shape,
+            mask_cache=mask_cache,
+        )
         brain_status = head_components["masks"].get("brain", {})
         head_complete = bool(brain_status.get("complete"))
         if not head_complete:
@@ -753,6 +775,7 @@ def main() -> int:
             cerebral_bleed_dir / f"{BLEED_MASK_NAME}.nii.gz",
             spacing_xyz,
             reference_shape,
+            mask_cache=mask_cache,
         )
         brain_structures = collect_mask_statuses(
             brain_structures_dir,
@@ -762,7 +785,7 @@ def main() -> int:
         )
         usable_structure_names = _usable_structure_mask_names(brain_structures)
         omitted_structure_masks = _omitted_structure_masks(brain_structures)
-        brain_mask = _load_mask(brain_mask_path) if brain_mask_path.exists() else None
+        brain_mask = _load_mask(brain_mask_path, mask_cache) if brain_mask_path.exists() else None
         structure_masks: dict[str, np.ndarray] = {}
         for mask_name in BRAIN_STRUCTURE_MASKS:
             if mask_name not in usable_structure_names:
@@ -776,13 +799,14 @@ def main() -> int:
                 if tuple(mask.shape) == tuple(reference_shape):
                     structure_masks[mask_name] = mask
         bleed_mask_path = cerebral_bleed_dir / f"{BLEED_MASK_NAME}.nii.gz"
-        bleed_mask = _load_mask(bleed_mask_path) if bleed_mask_path.exists() else None
+        bleed_mask = _load_mask(bleed_mask_path, mask_cache) if bleed_mask_path.exists() else None
         raw_has_cerebral_bleed = bool(bleed_mask is not None and np.count_nonzero(bleed_mask) > 0)
         bleed_support_qc = _bleed_anatomic_support_qc(
             bleed_mask,
             total_dir=total_dir,
             reference_shape=reference_shape,
             dilation_iterations=int(job_config.get("bleed_support_qc_dilation_iterations", 2)),
+            mask_cache=mask_cache,
         )
         has_cerebral_bleed = bool(raw_has_cerebral_bleed and bleed_support_qc.get("passed"))
         volume_rows = _volume_rows(
@@ -71,8 +71,7 @@ def load_job_config(raw_json: str) -> dict:
 
 def load_mask(mask_path: Path) -> tuple[nib.Nifti1Image, np.ndarray]:
     image = nib.load(str(mask_path))
-    data = np.asarray(image.get_fdata())
-    return image, data > 0
+    return image, np.asanyarray(image.dataobj) > 0
 
 
 def _load_case_metadata(case_id: str, case_dir: Path) -> tuple[dict, str]:
@@ -89,7 +88,7 @@ def _load_case_metadata(case_id: str, case_dir: Path) -> tuple[dict, str]:
 
 
 def compute_center_slice(mask_l3: np.ndarray) -> tuple[np.ndarray, int]:
-    slice_indices = np.where(mask_l3.sum(axis=(0, 1)) > 0)[0]
+    slice_indices = np.flatnonzero(mask_l3.any(axis=(0, 1)))
     if len(slice_indices) == 0:
         raise MetricSkip("L3 mask is empty")
     center_idx = int(slice_indices[len(slice_indices) // 2])
@@ -101,10 +100,11 @@ def calculate_mask_hu_statistics(image_slice: np.ndarray, mask_slice: np.ndarray
     voxels = np.asarray(image_slice, dtype=np.float32)[mask_bool]
     if voxels.size == 0:
         return {"voxel_count": 0, "mean_hu": None, "std_hu": None}
+    mean_hu = np.mean(voxels)
     return {
         "voxel_count": int(voxels.size),
-        "mean_hu": round(float(np.mean(voxels)), 2),
-        "std_hu": round(float(np.std(voxels)), 2),
+        "mean_hu": round(float(mean_hu), 2),
+        "std_hu": round(float(np.std(voxels, mean=mean_hu)), 2),
     }
 
 
@@ -502,7 +502,7 @@ def main() -> int:
         suppress_density = technique_context.get("contrast") is True
 
         ct_img = nib.load(str(ct_path))
-        ct_data = np.asarray(ct_img.get_fdata(), dtype=np.float32)
+        ct_data = ct_img.get_fdata(dtype=np.float32)
         _, l3_mask = load_mask(l3_path)
         muscle_img, muscle_mask = load_mask(muscle_path)
 
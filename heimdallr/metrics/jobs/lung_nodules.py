@@ -241,7 +241,7 @@ def _component_summary(mask: np.ndarray, voxel_volume_cm3: float) -> list[dict[s
 
 
 def _center_slice(mask: np.ndarray) -> int:
-    z_indices = np.where(np.asarray(mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    z_indices = np.flatnonzero(np.asarray(mask, dtype=bool).any(axis=(0, 1)))
     if len(z_indices) == 0:
         return int(mask.shape[2] // 2)
     return int(z_indices[len(z_indices) // 2])
@@ -175,7 +175,7 @@ def _compute_mask_measurement(
         }
 
     mask_bool = np.asarray(organ_mask, dtype=bool)
-    voxel_count = int(mask_bool.sum())
+    voxel_count = int(np.count_nonzero(mask_bool))
     if voxel_count == 0:
         return {
             "organ_key": organ_key,
@@ -197,8 +197,12 @@ def _compute_mask_measurement(
         hu_std = None
     else:
         hu_values = ct_data[mask_bool]
-        hu_mean = round(float(np.mean(hu_values)), 2) if hu_values.size else None
-        hu_std = round(float(np.std(hu_values)), 2) if hu_values.size else None
+        hu_mean = None
+        hu_std = None
+        if hu_values.size:
+            mean_value = np.mean(hu_values)
+            hu_mean = round(float(mean_value), 2)
+            hu_std = round(float(np.std(hu_values, mean=mean_value)), 2)
     estimated_pdff_percent = None
     if organ_key == "liver" and not suppress_density:
         estimated_pdff_percent = estimate_pdff_from_unenhanced_ct_hu(hu_mean)
@@ -206,7 +210,7 @@ def _compute_mask_measurement(
     voxel_volume_cm3 = float(spacing_xyz[0] * spacing_xyz[1] * spacing_xyz[2]) / 1000.0
     attenuation_sample_volume_cm3 = round(voxel_count * voxel_volume_cm3, 3)
     observed_volume_cm3 = round(voxel_count * voxel_volume_cm3, 3) if complete else None
-    occupied_indices = np.where(mask_bool.sum(axis=(0, 1)) > 0)[0]
+    occupied_indices = np.flatnonzero(mask_bool.any(axis=(0, 1)))
     axial_slice_extent = None
     attenuation_sample_slice_count = int(occupied_indices.size)
     attenuation_sample_axial_extent_mm = 0.0
@@ -401,7 +405,7 @@ def _build_export_slabs(
     spacing_z: float,
     slab_thickness_mm: float,
 ) -> list[dict[str, Any]]:
-    occupied_indices = np.where(np.asarray(union_mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    occupied_indices = np.flatnonzero(np.asarray(union_mask, dtype=bool).any(axis=(0, 1)))
     if occupied_indices.size == 0:
         return []
 
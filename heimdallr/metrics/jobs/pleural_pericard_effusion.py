@@ -119,21 +119,15 @@ def _load_mask(path: Path, reference_shape: tuple[int, ...]) -> tuple[np.ndarray
     return mask, status
 
 
-def _load_lung_union(artifacts_dir: Path, reference_shape: tuple[int, ...]) -> np.ndarray:
-    union = np.zeros(reference_shape, dtype=bool)
+def _load_lung_sides(artifacts_dir: Path, reference_shape: tuple[int, ...]) -> dict[str, np.ndarray]:
+    sides = {
+        "left": np.zeros(reference_shape, dtype=bool),
+        "right": np.zeros(reference_shape, dtype=bool),
+    }
     for name in LUNG_MASK_NAMES:
         mask, _status = _load_mask(artifacts_dir / "total" / f"{name}.nii.gz", reference_shape)
-        union |= mask
-    return union
-
-
-def _load_lung_side(artifacts_dir: Path, reference_shape: tuple[int, ...], side: str) -> np.ndarray:
-    names = [name for name in LUNG_MASK_NAMES if name.endswith(f"_{side}")]
-    union = np.zeros(reference_shape, dtype=bool)
-    for name in names:
-        mask, _status = _load_mask(artifacts_dir / "total" / f"{name}.nii.gz", reference_shape)
-        union |= mask
-    return union
+        sides[name.rsplit("_", 1)[1]] |= mask
+    return sides
 
 
 def _surface_points_mm(mask: np.ndarray, spacing_xyz: tuple[float, float, float]) -> np.ndarray:
@@ -266,7 +260,7 @@ def _build_positive_slabs(
     spacing_z: float,
     slab_thickness_mm: float = TARGET_SLICE_THICKNESS_MM,
 ) -> list[dict[str, Any]]:
-    occupied = np.where(np.asarray(union_mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    occupied = np.flatnonzero(np.asarray(union_mask, dtype=bool).any(axis=(0, 1)))
     if occupied.size == 0:
         return []
     positions = np.arange(union_mask.shape[2], dtype=np.float32) * float(spacing_z)
@@ -412,9 +406,10 @@ def main() -> int:
         ct_img, ct_data = load_ct_volume(ct_path)
         reference_shape = tuple(int(value) for value in ct_data.shape[:3])
         voxel_volume_cm3 = _voxel_volume_cm3(ct_img)
-        lung_mask = _load_lung_union(artifacts_dir, reference_shape)
-        left_lung_mask = _load_lung_side(artifacts_dir, reference_shape, "left")
-        right_lung_mask = _load_lung_side(artifacts_dir, reference_shape, "right")
+        lung_sides = _load_lung_sides(artifacts_dir, reference_shape)
+        left_lung_mask = lung_sides["left"]
+        right_lung_mask = lung_sides["right"]
+        lung_mask = left_lung_mask | right_lung_mask
         positive_findings: dict[str, dict[str, Any]] = {}
         positive_masks: dict[str, np.ndarray] = {}
         mask_statuses: dict[str, dict[str, Any]] = {}
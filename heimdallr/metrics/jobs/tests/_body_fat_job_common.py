@@ -40,7 +40,7 @@ def load_case_json_bundle(case_id: str) -> dict[str, Any]:
 
 
 def mask_axial_extent(mask: np.ndarray) -> tuple[int, int] | None:
-    z_indices = np.where(np.asarray(mask, dtype=bool).sum(axis=(0, 1)) > 0)[0]
+    z_indices = np.flatnonzero(np.asarray(mask, dtype=bool).any(axis=(0, 1)))
     if len(z_indices) == 0:
         return None
     return int(z_indices[0]), int(z_indices[-1])
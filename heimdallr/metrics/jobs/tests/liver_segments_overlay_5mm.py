@@ -53,7 +53,7 @@ SEGMENT_DEFINITIONS = [
 
 def _compute_mask_measurement(mask_data: np.ndarray, spacing_xyz: tuple[float, float, float]) -> dict[str, Any]:
     mask_bool = np.asarray(mask_data, dtype=bool)
-    voxel_count = int(mask_bool.sum())
+    voxel_count = int(np.count_nonzero(mask_bool))
     if voxel_count == 0:
         return {
             "voxel_count": 0,
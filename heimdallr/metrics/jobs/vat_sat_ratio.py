@@ -67,8 +67,7 @@ def load_job_config(raw_json: str) -> dict:
 
 def load_mask(mask_path: Path) -> tuple[nib.Nifti1Image, np.ndarray]:
     image = nib.load(str(mask_path))
-    data = np.asarray(image.get_fdata())
-    return image, data > 0
+    return image, np.asanyarray(image.dataobj) > 0
 
 
 def _load_case_metadata(case_id: str, case_dir: Path) -> dict:
@@ -95,7 +94,7 @@ def _selected_phase_from_metadata(case_metadata: dict) -> str:
 
 
 def compute_center_slice(mask_l3: np.ndarray) -> tuple[np.ndarray, int]:
-    slice_indices = np.where(mask_l3.sum(axis=(0, 1)) > 0)[0]
+    slice_indices = np.flatnonzero(mask_l3.any(axis=(0, 1)))
     if len(slice_indices) == 0:
         raise MetricSkip("L3 mask is empty")
     center_idx = int(slice_indices[len(slice_indices) // 2])
@@ -40,12 +40,16 @@ from heimdallr.shared.automatic_ct import (
 from heimdallr.shared.paths import study_dir, study_id_json, study_logs_dir, study_results_json
 from heimdallr.shared.segmentation_inventory import load_segmentation_inventory
 from heimdallr.shared.sqlite import connect as db_connect
+from heimdallr.shared.spool import atomic_write_text
 
 settings.configure_service_stdio()
 
 
 LOCAL_TZ = ZoneInfo(settings.TIMEZONE)
 _ACTIVE_CHILD_PROCESSES: set[subprocess.Popen[str]] = set()
+# Cases and jobs already run as parallel subprocesses, so each job keeps its
+# numerical libraries single-threaded unless the operator exports otherwise.
+_JOB_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
 _ACTIVE_CHILDREN_LOCK = threading.Lock()
 _SHUTDOWN_EVENT = threading.Event()
 JOB_NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
@@ -492,14 +496,25 @@ def _load_case_metadata(case_id: str) -> dict:
         return json.load(handle)
 
 
-def _write_case_metadata(case_id: str, metadata: dict) -> None:
+def _write_case_metadata(case_id: str, metadata: dict, *, metrics_profile: str | None = None) -> None:
     metadata_path = study_id_json(case_id)
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    # Serialize once: the same text goes to id.json and to the IdJson column.
+    metadata_json = json.dumps(metadata, indent=2)
+    atomic_write_text(metadata_path, metadata_json)
     study_uid = metadata.get("StudyInstanceUID")
     if study_uid:
         conn = db_connect()
         try:
-            store.update_id_json(conn, study_uid, metadata)
+            if metrics_profile is None:
+                store.update_id_json(conn, study_uid, metadata, metadata_json=metadata_json)
+            else:
+                store.record_metrics_completion(
+                    conn,
+                    study_uid,
+                    metadata,
+                    profile_name=metrics_profile,
+                    metadata_json=metadata_json,
+                )
         finally:
             conn.close()
 
@@ -572,13 +587,14 @@ def _load_results(case_id: str) -> dict:
 
 def _write_results(case_id: str, results: dict, metadata: dict) -> None:
     results_path = study_results_json(case_id)
-    results_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    results_json = json.dumps(results, indent=2)
+    atomic_write_text(results_path, results_json)
 
     study_uid = metadata.get("StudyInstanceUID")
     if study_uid:
         conn = db_connect()
         try:
-            store.update_calculation_results(conn, study_uid, results)
+            store.update_calculation_results(conn, study_uid, results, results_json=results_json)
         finally:
             conn.close()
 
@@ -739,6 +755,13 @@ def _phase_allowed_with_fallback(allowed_phases: set[str], selected_phase: str)
     return "native" in allowed_phases and _is_contrast_phase(normalized_selected_phase)
 
 
+def _job_subprocess_env() -> dict[str, str]:
+    env = os.environ.copy()
+    for name in _JOB_THREAD_ENV_VARS:
+        env.setdefault(name, "1")
+    return env
+
+
 def _run_job(case_id: str, job: dict, log_dir: Path) -> dict:
     job_name = job["name"]
     module_name = _resolve_job_module_name(job)
@@ -758,6 +781,7 @@ def _run_job(case_id: str, job: dict, log_dir: Path) -> dict:
         stderr=subprocess.PIPE,
         text=True,
         start_new_session=True,
+        env=_job_subprocess_env(),
     )
     _register_child_process(proc)
     try:
@@ -1229,18 +1253,8 @@ def segment_case_metrics(case_input: Path, queue_id: int | None = None) -> bool:
             "dicom_egress_items_enqueued": enqueued_dicom_exports,
         }
         metadata["Pipeline"] = pipeline
-        _write_case_metadata(case_id, metadata)
+        _write_case_metadata(case_id, metadata, metrics_profile=profile_name)
         study_uid = str(metadata.get("StudyInstanceUID", "") or "").strip()
-        if study_uid:
-            conn = db_connect()
-            try:
-                store.update_metrics_completion(
-                    conn,
-                    study_uid,
-                    profile_name=profile_name,
-                )
-            finally:
-                conn.close()
         external_delivery = metadata.get("ExternalDelivery", {})
         if canceled:
             logger.log("[Metrics] Skipping final package delivery because the queue item was canceled")
@@ -1265,8 +1279,8 @@ def segment_case_metrics(case_input: Path, queue_id: int | None = None) -> bool:
                 end_dt=datetime.datetime.now(LOCAL_TZ),
                 error=str(exc),
             )
-        except Exception:
-            pass
+        except Exception as state_exc:
+            logger.log(f"[Metrics] Warning: failed to record error state in id.json: {state_exc}")
         logger.log(f"[Metrics] Error for {case_id}: {exc}")
         logger.close()
         return False
@@ -68,7 +68,7 @@ from heimdallr.shared.paths import (
     study_results_json,
     study_source_dir,
 )
-from heimdallr.shared.spool import CLAIM_SUFFIX, claim_path, unclaim_path
+from heimdallr.shared.spool import CLAIM_SUFFIX, atomic_write_text, claim_path, unclaim_path
 from heimdallr.shared.study_manifest import build_study_manifest_digest
 from heimdallr.shared.qc_evidence import (
     build_inventory as build_qc_inventory,
@@ -154,7 +154,10 @@ def persist_source_dicom_series(series_map: dict, destination_root: Path) -> dic
         copied = 0
         for index, source_path in enumerate(series_data.get("files", []), start=1):
             destination = series_dir / f"instance_{index:06d}.dcm"
-            shutil.copy2(source_path, destination)
+            try:
+                os.link(source_path, destination)
+            except OSError:
+                shutil.copy2(source_path, destination)
             copied += 1
         persisted[uid] = {
             "path": series_dir,
@@ -1590,6 +1593,7 @@ def convert_series(series_id, files_list, output_nii_path, temp_dir, *, modality
     return None
 
 def process_zip(zip_path):
+    prepare_started = time.perf_counter()
     prepare_start_dt = datetime.datetime.now(LOCAL_TZ)
     prepare_start_time_str = prepare_start_dt.isoformat()
     stage_timings = {}
@@ -1601,7 +1605,10 @@ def process_zip(zip_path):
 
     print(f"=== Prepare Upload: {unclaim_path(zip_path).name} ===")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Extract next to the study tree: persisting NIfTIs and source DICOMs is
+    # then a rename or hard link rather than a cross-filesystem copy.
+    settings.WORK_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="prepare-", dir=settings.WORK_DIR) as temp_dir:
         temp_dir = Path(temp_dir)
         extract_dir = temp_dir / "extracted"
         extract_dir.mkdir()
@@ -1898,10 +1905,8 @@ def process_zip(zip_path):
                 height=metadata_data.get("Height"),
             )
         
-        with open(study_id_json(case_id), "w") as f:
-            json.dump(id_data, f, indent=2)
-        with open(study_metadata_json(case_id), "w") as f:
-            json.dump(metadata_data, f, indent=2)
+        atomic_write_text(study_id_json(case_id), json.dumps(id_data, indent=2))
+        atomic_write_text(study_metadata_json(case_id), json.dumps(metadata_data, indent=2))
 
         available_series = []
         conversion_series_map = series_map
@@ -2132,7 +2137,7 @@ def process_zip(zip_path):
             )
             prepare_end_dt = datetime.datetime.now(LOCAL_TZ)
             prepare_elapsed_str = str(prepare_end_dt - prepare_start_dt)
-            stage_timings["total_prepare_seconds"] = round((prepare_end_dt - prepare_start_dt).total_seconds(), 3)
+            stage_timings["total_prepare_seconds"] = round(time.perf_counter() - prepare_started, 3)
 
             prepare_pipeline_updates = {
                 "prepare_start_time": prepare_start_time_str,
@@ -2198,10 +2203,8 @@ def process_zip(zip_path):
             output_metadata["QcEvidence"] = qc_context
             
             # Save updated id.json
-            with open(study_id_json(case_id), "w") as f:
-                json.dump(output_meta, f, indent=2)
-            with open(study_metadata_json(case_id), "w") as f:
-                json.dump(output_metadata, f, indent=2)
+            atomic_write_text(study_id_json(case_id), json.dumps(output_meta, indent=2))
+            atomic_write_text(study_metadata_json(case_id), json.dumps(output_metadata, indent=2))
 
             try:
                 study_uid = output_meta.get("StudyInstanceUID")
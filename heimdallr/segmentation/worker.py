@@ -23,11 +23,13 @@ cases to the metrics stage.
 
 import os
 import copy
+import contextlib
 import json
 import gzip
 import shutil
 import signal
 import subprocess
+import tempfile
 import threading
 import sys
 import time
@@ -46,6 +48,7 @@ from heimdallr.metrics.head import HEAD_COMPONENT_MASKS, collect_mask_statuses,
 from heimdallr.shared import settings
 from heimdallr.shared import store
 from heimdallr.shared.accelerator_slots import accelerator_slot
+from heimdallr.shared.spool import atomic_write_text
 from heimdallr.integration.delivery import enqueue_case_failed_delivery
 from heimdallr.shared.paths import (
     study_artifacts_dir,
@@ -223,8 +226,7 @@ def _record_segmentation_pipeline_state(
             )
 
     meta["Pipeline"] = pipeline_data
-    with open(id_json_path, "w", encoding="utf-8") as handle:
-        json.dump(meta, handle, indent=2)
+    atomic_write_text(id_json_path, json.dumps(meta, indent=2))
 
     study_uid = meta.get("StudyInstanceUID")
     if study_uid:
@@ -1278,6 +1280,17 @@ def _clear_task_output(case_output: Path, task: dict) -> None:
         shutil.rmtree(output_dir)
 
 
+def _empty_task_output_dir(output_dir: Path) -> None:
+    """Remove stale outputs in place so the task directory itself is reused."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
 def _load_mask_status(mask_path: Path, reference_image_path: Path) -> dict:
     return mask_inventory_status(mask_path, reference_image_path)
 
@@ -1290,7 +1303,7 @@ def _head_union_status(total_dir: Path, head_components: dict, spacing_xyz: tupl
             return compute_mask_status(None, spacing_xyz)
         mask_path = total_dir / f"{mask_name}.nii.gz"
         image = nib.load(str(mask_path))
-        mask = np.asarray(image.get_fdata(), dtype=np.float32) > 0
+        mask = np.asanyarray(image.dataobj) > 0
         union = mask if union is None else (union | mask)
     return compute_mask_status(union, spacing_xyz)
 
@@ -1367,6 +1380,93 @@ def _automatic_ct_required_task_names(
     }
 
 
+def _gunzip_to(source_path: Path, target) -> None:
+    """Decompress ``source_path`` into an open binary file, using pigz when installed."""
+    pigz = shutil.which("pigz")
+    if pigz:
+        threads = str(max(1, os.cpu_count() or 1))
+        subprocess.run([pigz, "-dc", "-p", threads, str(source_path)], stdout=target, check=True)
+        return
+    with gzip.open(source_path, "rb") as source:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+
+
+@contextlib.contextmanager
+def _uncompressed_segmentation_input(case_id: str, nifti_path, task_count: int, *, logger):
+    """Yield a scratch `.nii` copy of the input when several tasks will read it.
+
+    Every TotalSegmentator subprocess gunzips its input again; decompressing
+    once into ``SEGMENTATION_INPUT_SCRATCH_DIR`` (ideally tmpfs) avoids that.
+    Falls back to the original path when disabled or when the copy fails.
+    """
+    nifti_path = Path(nifti_path)
+    scratch_root = settings.SEGMENTATION_INPUT_SCRATCH_DIR
+    if not scratch_root or task_count < 2 or nifti_path.suffixes[-2:] != [".nii", ".gz"]:
+        yield nifti_path
+        return
+
+    scratch_path = None
+    try:
+        Path(scratch_root).mkdir(parents=True, exist_ok=True)
+        handle, scratch_name = tempfile.mkstemp(prefix=f".{case_id}.", suffix=".nii", dir=scratch_root)
+        scratch_path = Path(scratch_name)
+        with os.fdopen(handle, "wb") as target:
+            _gunzip_to(nifti_path, target)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        logger.print(f"[Segmentation] Warning: using compressed input, scratch copy failed: {exc}")
+        if scratch_path is not None:
+            scratch_path.unlink(missing_ok=True)
+        scratch_path = None
+
+    # Yield outside the handler so pipeline errors do not chain the copy failure.
+    if scratch_path is None:
+        yield nifti_path
+        return
+
+    logger.print(f"[Segmentation] Decompressed input for {task_count} tasks: {scratch_path}")
+    try:
+        yield scratch_path
+    finally:
+        scratch_path.unlink(missing_ok=True)
+
+
+def _run_planned_task(task_run: dict) -> None:
+    run_task(
+        task_run["task_name"],
+        task_run["input_file"],
+        task_run["output_folder"],
+        extra_args=task_run["extra_args"],
+        log_file=task_run["log_file"],
+    )
+
+
+def _run_independent_tasks(task_runs: list[dict], *, max_parallel: int, logger) -> None:
+    """Run post-`total` TotalSegmentator tasks, overlapping up to ``max_parallel``.
+
+    GPU admission is still enforced per subprocess by ``run_task`` through the
+    host-wide accelerator slots, so overlap only fills idle capacity.
+    """
+    workers = min(max(int(max_parallel), 1), len(task_runs))
+    if workers <= 1:
+        for task_run in task_runs:
+            _run_planned_task(task_run)
+        return
+
+    logger.print(f"[Segmentation] Running {len(task_runs)} tasks with up to {workers} in parallel")
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="segmentation-task",
+    )
+    try:
+        futures = [executor.submit(_run_planned_task, task_run) for task_run in task_runs]
+        for future in futures:
+            future.result()
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+
 def run_segmentation_pipeline(
     case_id,
     modality,
@@ -1377,8 +1477,13 @@ def run_segmentation_pipeline(
     log_dir,
     logger,
     requested_metrics_modules: list[str] | None = None,
+    task_input_path=None,
 ):
-    """Execute the configured segmentation task list for the selected series."""
+    """Execute the configured segmentation task list for the selected series.
+
+    ``task_input_path`` replaces ``nifti_path`` only as the TotalSegmentator
+    input; gatekeepers and the inventory keep referencing the case file.
+    """
     profile_name, tasks = resolve_segmentation_plan(
         modality,
         selected_phase,
@@ -1402,6 +1507,7 @@ def run_segmentation_pipeline(
     automatic_plan: dict | None = None
     automatic_required_task_names: set[str] | None = None
     automatic_plan_resolved = False
+    deferred_runs: list[tuple[dict, dict]] = []
 
     if automatic_ct and not any(_task_name(task) == "total" for task in ordered_tasks):
         raise RuntimeError(f"Automatic CT segmentation profile '{profile_name}' must enable the total task")
@@ -1462,20 +1568,25 @@ def run_segmentation_pipeline(
 
         extra_args = [str(arg) for arg in task.get("extra_args", [])]
         output_dir = _task_output_path(case_output, task)
-        if output_dir.exists():
-            shutil.rmtree(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _empty_task_output_dir(output_dir)
 
         log_file = None if settings.VERBOSE_CONSOLE else log_dir / f"{task_name}.log"
-        run_task(
-            task_name,
-            nifti_path,
-            output_dir,
-            extra_args=extra_args,
-            log_file=log_file,
-        )
         executed = dict(task)
         executed["extra_args"] = extra_args
+        task_run = {
+            "task_name": task_name,
+            "input_file": task_input_path or nifti_path,
+            "output_folder": output_dir,
+            "extra_args": extra_args,
+            "log_file": log_file,
+        }
+        if task_name != "total":
+            # Every other task only reads the selected series and the `total`
+            # outputs already gated above, so they can overlap each other.
+            deferred_runs.append((task_run, _task_record(executed)))
+            continue
+
+        _run_planned_task(task_run)
         executed_tasks.append(_task_record(executed))
 
         if automatic_ct and task_name == "total":
@@ -1495,6 +1606,13 @@ def run_segmentation_pipeline(
                 )
             )
 
+    _run_independent_tasks(
+        [task_run for task_run, _ in deferred_runs],
+        max_parallel=settings.SEGMENTATION_MAX_PARALLEL_TASKS,
+        logger=logger,
+    )
+    executed_tasks.extend(record for _, record in deferred_runs)
+
     payload = {
         "profile": profile_name,
         "requested_metrics_modules": list(requested_metrics_modules or []),
@@ -1851,6 +1969,7 @@ def segment_case(case_input, queue_id: int | None = None):
     logger = PipelineLogger(pipeline_log_path)
 
     nifti_path = None
+    id_data = None
     if selected_from_prepared_study:
         id_json_path = study_id_json(case_id)
         if not id_json_path.exists():
@@ -1905,8 +2024,12 @@ def segment_case(case_input, queue_id: int | None = None):
         id_json_path = study_id_json(case_id)
         if id_json_path.exists():
             try:
-                with open(id_json_path, "r") as f:
-                    meta = json.load(f)
+                if id_data is not None:
+                    # Parsed moments ago for series selection; reuse it.
+                    meta = id_data
+                else:
+                    with open(id_json_path, "r") as f:
+                        meta = json.load(f)
                 modality = meta.get("Modality", "CT")
                 study_uid = meta.get("StudyInstanceUID")
                 requested_metrics_modules = _requested_metrics_modules_from_metadata(meta)
@@ -1930,10 +2053,9 @@ def segment_case(case_input, queue_id: int | None = None):
                     pipeline_data["series_selection"] = selection_info
                 meta["Pipeline"] = pipeline_data
 
-                with open(id_json_path, "w") as f:
-                    json.dump(meta, f, indent=2)
-            except Exception:
-                pass
+                atomic_write_text(id_json_path, json.dumps(meta, indent=2))
+            except Exception as e:
+                logger.print(f"  [Warning] Failed to record segmentation start in id.json: {e}")
         logger.print(f"Detected modality: {modality}")
         if selection_info is not None:
             logger.print(
@@ -1945,7 +2067,7 @@ def segment_case(case_input, queue_id: int | None = None):
             selected_phase,
             requested_metrics_modules=requested_metrics_modules,
         )
-        seg_start_time = time.time()
+        seg_start_time = time.perf_counter()
         should_reuse, recorded_elapsed_time = should_reuse_existing_segmentation(
             study_uid,
             case_output,
@@ -1971,22 +2093,29 @@ def segment_case(case_input, queue_id: int | None = None):
             }
             if recorded_elapsed_time:
                 segmentation_info["original_elapsed_time"] = recorded_elapsed_time
-            seg_elapsed = time.time() - seg_start_time
+            seg_elapsed = time.perf_counter() - seg_start_time
             logger.print("[Segmentation] Reusing existing outputs for identical selected series signature")
             logger.print(f"[Segmentation] ✓ Complete ({seg_elapsed:.1f}s)")
         else:
-            segmentation_info = run_segmentation_pipeline(
-                case_id=case_id,
-                modality=modality,
-                selected_phase=selected_phase,
-                nifti_path=nifti_path,
-                case_output=case_output,
-                artifacts_dir=artifacts_dir,
-                log_dir=log_dir,
+            with _uncompressed_segmentation_input(
+                case_id,
+                nifti_path,
+                len(planned_tasks),
                 logger=logger,
-                requested_metrics_modules=requested_metrics_modules,
-            )
-            seg_elapsed = time.time() - seg_start_time
+            ) as task_input:
+                segmentation_info = run_segmentation_pipeline(
+                    case_id=case_id,
+                    modality=modality,
+                    selected_phase=selected_phase,
+                    nifti_path=nifti_path,
+                    case_output=case_output,
+                    artifacts_dir=artifacts_dir,
+                    log_dir=log_dir,
+                    logger=logger,
+                    requested_metrics_modules=requested_metrics_modules,
+                    task_input_path=task_input,
+                )
+            seg_elapsed = time.perf_counter() - seg_start_time
             logger.print(f"[Segmentation] ✓ Complete ({seg_elapsed:.1f}s)")
             if study_uid and selection_info is not None:
                 coverage_class = classify_segmentation_coverage(artifacts_dir / "total")
@@ -2007,6 +2136,7 @@ def segment_case(case_input, queue_id: int | None = None):
         if not settings.VERBOSE_CONSOLE:
             logger.print(f"  → Logs: {log_dir.relative_to(settings.STUDIES_DIR.parent)}/")
 
+        completed_elapsed_str = None
         try:
             id_json_path = study_id_json(case_id)
             if id_json_path.exists():
@@ -2068,8 +2198,8 @@ def segment_case(case_input, queue_id: int | None = None):
                     pipeline_data["segmentation_original_elapsed_time"] = elapsed_str
 
                 meta["Pipeline"] = pipeline_data
-                with open(id_json_path, "w") as f:
-                    json.dump(meta, f, indent=2)
+                atomic_write_text(id_json_path, json.dumps(meta, indent=2))
+                completed_elapsed_str = pipeline_data["elapsed_time"]
 
                 try:
                     study_uid = meta.get("StudyInstanceUID")
@@ -2106,6 +2236,13 @@ def segment_case(case_input, queue_id: int | None = None):
                     else:
                         shutil.move(str(nifti_path), str(final_nii_path))
 
+            if study_uid and final_nii_path.exists():
+                conn = db_connect()
+                try:
+                    store.update_file_size(conn, study_uid, final_nii_path.stat().st_size)
+                finally:
+                    conn.close()
+
             if not settings.VERBOSE_CONSOLE:
                 logger.print(f"\n[Archive] ✓ Canonical NIfTI in {final_nii_path.relative_to(settings.STUDIES_DIR.parent)}")
             else:
@@ -2114,12 +2251,9 @@ def segment_case(case_input, queue_id: int | None = None):
             logger.print(f"Error finalizing NIfTI: {e}")
 
         if not settings.VERBOSE_CONSOLE:
-            try:
-                with open(study_id_json(case_id), "r") as f:
-                    meta = json.load(f)
-                    elapsed_str = meta.get("Pipeline", {}).get("elapsed_time", "Unknown")
-                    logger.print(f"\n✅ Case complete ({elapsed_str})")
-            except Exception:
+            if completed_elapsed_str is not None:
+                logger.print(f"\n✅ Case complete ({completed_elapsed_str})")
+            else:
                 logger.print("\n✅ Case complete")
 
         try:
@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
+import sqlite3
+import threading
 from collections.abc import Generator
 
+from . import settings
 from .sqlite import connect
 from .store import ensure_schema
 
+# Idle connections kept per database path. Requests check one out instead of
+# opening a new connection and re-applying the WAL pragmas every time; SQLite
+# still serializes writers across the pooled connections.
+DB_POOL_MAX_IDLE = 8
+
+_idle_connections: dict[str, list[sqlite3.Connection]] = {}
+_idle_lock = threading.Lock()
+
+
+def _checkout_connection() -> tuple[str, sqlite3.Connection]:
+    pool_key = str(settings.DB_PATH)
+    with _idle_lock:
+        idle = _idle_connections.get(pool_key)
+        if idle:
+            return pool_key, idle.pop()
+    return pool_key, connect(check_same_thread=False)
+
+
+def _checkin_connection(pool_key: str, conn: sqlite3.Connection) -> None:
+    if conn.in_transaction:
+        conn.rollback()
+    with _idle_lock:
+        idle = _idle_connections.setdefault(pool_key, [])
+        if len(idle) < DB_POOL_MAX_IDLE:
+            idle.append(conn)
+            return
+    conn.close()
+
 
 def get_db() -> Generator:
-    """Yield a SQLite connection scoped to one request."""
-    conn = None
+    """Yield a pooled SQLite connection for the duration of one request."""
+    pool_key, conn = _checkout_connection()
     try:
-        conn = connect(check_same_thread=False)
         ensure_schema(conn)
         yield conn
-    finally:
-        if conn:
-            conn.close()
+    except sqlite3.Error:
+        # Do not hand a connection in an unknown state to the next request.
+        conn.close()
+        raise
+    except BaseException:
+        _checkin_connection(pool_key, conn)
+        raise
+    _checkin_connection(pool_key, conn)
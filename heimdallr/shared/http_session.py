@@ -0,0 +1,19 @@
+"""Shared outbound HTTP session helpers."""
+
+from __future__ import annotations
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+
+
+def new_http_session() -> requests.Session:
+    """Return a keep-alive session that never carries cookies between requests.
+
+    Resident workers post to the same few destinations for their whole
+    lifetime, so pooling avoids a TCP/TLS handshake per item. Cookies are
+    refused to keep each request as stateless as a bare ``requests.request``.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import List
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class PatientResponse(BaseModel):
@@ -36,6 +36,12 @@ class BiometricData(BaseModel):
     weight: float = Field(gt=0, le=500, description="Patient weight in kilograms")
     height: float = Field(gt=0, le=3.0, description="Patient height in meters")
 
+    @computed_field
+    @property
+    def bmi(self) -> float:
+        """Body mass index in kg/m^2, rounded for display."""
+        return round(self.weight / (self.height * self.height), 2)
+
 
 class SMIData(BaseModel):
     smi: float = Field(gt=0, le=200, description="Skeletal Muscle Index in cm^2/m^2")
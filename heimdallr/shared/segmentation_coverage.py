@@ -56,19 +56,20 @@ def mask_complete(mask: np.ndarray) -> bool:
 
 def _load_complete_mask_names(total_artifacts_dir: Path) -> set[str]:
     complete = set()
-    if not total_artifacts_dir.exists():
+    if not total_artifacts_dir.is_dir():
         return complete
 
+    # One directory listing instead of a stat() per candidate mask.
+    present = {path.name for path in total_artifacts_dir.iterdir()}
     for mask_name in _LUNG_MASK_NAMES + _ABDOMINAL_MASK_NAMES:
-        mask_path = total_artifacts_dir / mask_name
-        if not mask_path.exists():
+        if mask_name not in present:
             continue
         try:
-            image = nib.load(str(mask_path))
-            data = image.get_fdata(dtype=np.float32)
+            image = nib.load(str(total_artifacts_dir / mask_name))
+            mask = np.asanyarray(image.dataobj) > 0
         except Exception:
             continue
-        if mask_complete(data > 0):
+        if mask_complete(mask):
             complete.add(mask_name)
     return complete
 
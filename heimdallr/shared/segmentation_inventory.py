@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 from pathlib import Path
 from typing import Any
@@ -30,6 +31,9 @@ LUNG_MASKS = (
 )
 HEAD_MASKS = ("skull", "brain")
 VERTEBRA_MASKS = ("vertebrae_L1", "vertebrae_L3")
+# Mask reads are dominated by gzip inflation, which releases the GIL. A few
+# threads overlap it without holding many decompressed volumes at once.
+INVENTORY_READ_WORKERS = 4
 
 
 def _reference_geometry(reference_image_path: Path) -> tuple[tuple[int, int, int], tuple[float, float, float]]:
@@ -51,17 +55,16 @@ def mask_inventory_status(mask_path: Path, reference_image_path: Path) -> dict[s
             "error": str(exc),
         }
 
-    if not mask_path.exists():
+    try:
+        mask_image = nib.load(str(mask_path))
+        mask = np.asanyarray(mask_image.dataobj) > 0
+    except FileNotFoundError:
         return {
             "present": False,
             "complete": False,
             "reason": "missing_mask",
             "mask": str(mask_path),
         }
-
-    try:
-        mask_image = nib.load(str(mask_path))
-        mask = np.asarray(mask_image.get_fdata(), dtype=np.float32) > 0
     except Exception as exc:
         return {
             "present": False,
@@ -103,8 +106,14 @@ def build_segmentation_inventory(total_dir: Path, reference_image_path: Path) ->
     }
 
     masks = inventory["masks"]
-    for mask_name in HEAD_MASKS + VERTEBRA_MASKS + PARENCHYMAL_ORGAN_MASKS + LUNG_MASKS:
-        masks[mask_name] = mask_inventory_status(total_dir / f"{mask_name}.nii.gz", reference_image_path)
+    mask_names = HEAD_MASKS + VERTEBRA_MASKS + PARENCHYMAL_ORGAN_MASKS + LUNG_MASKS
+    with concurrent.futures.ThreadPoolExecutor(max_workers=INVENTORY_READ_WORKERS) as executor:
+        statuses = executor.map(
+            lambda mask_name: mask_inventory_status(total_dir / f"{mask_name}.nii.gz", reference_image_path),
+            mask_names,
+        )
+        for mask_name, status in zip(mask_names, statuses):
+            masks[mask_name] = status
 
     brain = masks.get("brain", {})
     skull = masks.get("skull", {})
@@ -107,6 +107,9 @@ CONFIG_DIR = BASE_DIR / "config"
 INTAKE_DIR = RUNTIME_DIR / "intake"
 QUEUE_DIR = RUNTIME_DIR / "queue"
 STUDIES_DIR = RUNTIME_DIR / "studies"
+# Scratch space kept on the runtime filesystem so finished files can be
+# renamed into STUDIES_DIR instead of copied across devices.
+WORK_DIR = RUNTIME_DIR / "work"
 
 UPLOAD_DIR = INTAKE_DIR / "uploads"
 UPLOAD_FROM_PREPARE_DIR = UPLOAD_DIR / "from_prepare"
@@ -379,6 +382,22 @@ SEGMENTATION_MAX_PARALLEL_CASES = _config_int(
 )
 # Compatibility alias for integrations that still read the old settings symbol.
 MAX_PARALLEL_CASES = SEGMENTATION_MAX_PARALLEL_CASES
+SEGMENTATION_MAX_PARALLEL_TASKS = _config_int(
+    "HEIMDALLR_SEGMENTATION_MAX_PARALLEL_TASKS",
+    SEGMENTATION_PIPELINE_CONFIG,
+    ("execution", "max_parallel_tasks"),
+    1,
+)
+if SEGMENTATION_MAX_PARALLEL_TASKS < 1:
+    raise RuntimeError("HEIMDALLR_SEGMENTATION_MAX_PARALLEL_TASKS must be >= 1")
+# Optional directory (ideally tmpfs such as /dev/shm) for a one-time
+# decompressed copy of the segmentation input; empty keeps reading `.nii.gz`.
+SEGMENTATION_INPUT_SCRATCH_DIR = _config_str(
+    "HEIMDALLR_SEGMENTATION_INPUT_SCRATCH_DIR",
+    SEGMENTATION_PIPELINE_CONFIG,
+    ("execution", "input_scratch_dir"),
+    "",
+)
 ACCELERATOR_TASK_SLOTS = int(os.getenv("HEIMDALLR_ACCELERATOR_TASK_SLOTS", "0"))
 if ACCELERATOR_TASK_SLOTS < 0:
     raise RuntimeError("HEIMDALLR_ACCELERATOR_TASK_SLOTS must be >= 0")
@@ -523,6 +542,7 @@ def ensure_directories() -> None:
         INTAKE_DIR,
         QUEUE_DIR,
         STUDIES_DIR,
+        WORK_DIR,
         UPLOAD_DIR,
         UPLOAD_FROM_PREPARE_DIR,
         UPLOAD_EXTERNAL_DIR,
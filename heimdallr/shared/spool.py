@@ -2,34 +2,78 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import tempfile
 import uuid
 from pathlib import Path
 
 TEMP_SUFFIX = ".part"
 CLAIM_SUFFIX = ".working"
+COPY_CHUNK_SIZE = 1024 * 1024
+SENDFILE_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def temporary_spool_path(target_path: Path) -> Path:
+    """Return a hidden sibling path that spool scanners never pick up."""
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    return target_path.parent / f".{target_path.name}.{uuid.uuid4().hex}{TEMP_SUFFIX}"
 
 
 def atomic_write_bytes(target_path: Path, payload: bytes) -> Path:
     """Write bytes to disk via a temporary file and atomic rename."""
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = target_path.parent / f".{target_path.name}.{uuid.uuid4().hex}{TEMP_SUFFIX}"
+    temp_path = temporary_spool_path(target_path)
     with open(temp_path, "wb") as handle:
         handle.write(payload)
     temp_path.replace(target_path)
     return target_path
 
 
-def atomic_copy_stream(target_path: Path, source_stream) -> Path:
+def atomic_write_text(target_path: Path, text: str, *, encoding: str = "utf-8") -> Path:
+    """Write text to disk via a temporary file and atomic rename."""
+    return atomic_write_bytes(target_path, text.encode(encoding))
+
+
+def atomic_copy_stream(target_path: Path, source_stream, *, chunk_size: int = COPY_CHUNK_SIZE) -> Path:
     """Copy a stream to disk via a temporary file and atomic rename."""
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = target_path.parent / f".{target_path.name}.{uuid.uuid4().hex}{TEMP_SUFFIX}"
+    temp_path = temporary_spool_path(target_path)
     with open(temp_path, "wb") as handle:
-        shutil.copyfileobj(source_stream, handle)
+        if not _sendfile_copy(source_stream, handle):
+            shutil.copyfileobj(source_stream, handle, chunk_size)
     temp_path.replace(target_path)
     return target_path
 
 
+def _sendfile_copy(source_stream, handle) -> bool:
+    """Copy a disk-backed stream in the kernel; return False to fall back."""
+    if not hasattr(os, "sendfile"):
+        return False
+    if isinstance(source_stream, tempfile.SpooledTemporaryFile) and source_stream.name is None:
+        # Still in memory: fileno() would force a rollover to disk.
+        return False
+    try:
+        in_fd = source_stream.fileno()
+        # The kernel reads the fd directly, so buffered writes must land first.
+        source_stream.flush()
+        offset = source_stream.tell()
+    except (AttributeError, OSError, ValueError):
+        return False
+    out_fd = handle.fileno()
+    start = offset
+    while True:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, SENDFILE_CHUNK_SIZE)
+        except OSError:
+            if offset == start:
+                return False
+            raise
+        if sent == 0:
+            break
+        offset += sent
+    source_stream.seek(offset)
+    return True
+
+
 def claim_path(path: Path, suffix: str = CLAIM_SUFFIX) -> Path:
     """Claim a spooled file by atomically renaming it to a working suffix."""
     if path.name.endswith(suffix):
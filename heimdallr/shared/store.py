@@ -12,6 +12,12 @@ from . import settings
 from .sqlite import connect
 
 
+# Guarded by json_valid so a legacy malformed IdJson reads as NULL instead of
+# failing every write that touches the index.
+_CASE_ID_COLUMN_DEFINITION = (
+    "TEXT GENERATED ALWAYS AS "
+    "(CASE WHEN json_valid(IdJson) THEN json_extract(IdJson, '$.CaseID') END) VIRTUAL"
+)
 _DICOM_METADATA_COLUMNS = {
     "StudyInstanceUID": "TEXT PRIMARY KEY",
     "PatientName": "TEXT",
@@ -43,6 +49,7 @@ _DICOM_METADATA_COLUMNS = {
     "BoneHealthL1TrabecularHuMean": "REAL",
     "BoneHealthL1Classification": "TEXT",
     "BoneHealthL1QcPass": "INTEGER",
+    "FileSizeBytes": "INTEGER",
     "ArtifactsPurged": "INTEGER DEFAULT 0",
     "ArtifactsPurgedAt": "TIMESTAMP",
     "ProcessedAt": "TIMESTAMP",
@@ -144,10 +151,30 @@ def _is_stale_claimed_at(claimed_at: Any, *, ttl_seconds: int, heartbeat_at: Any
     return (datetime.now(LOCAL_TZ) - activity_at).total_seconds() >= max(int(ttl_seconds), 1)
 
 
+# Database file -> PRAGMA schema_version recorded after ensure_schema finished.
+# The migration is additive, so an unchanged schema_version means there is
+# nothing left to create and the call can return after one PRAGMA.
+_ENSURED_SCHEMA_VERSIONS: dict[str, int] = {}
+
+
+def _schema_state(conn: sqlite3.Connection) -> tuple[str, int]:
+    database_file = ""
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main":
+            database_file = str(row[2] or "")
+    schema_version = int(conn.execute("PRAGMA schema_version").fetchone()[0])
+    return database_file, schema_version
+
+
 def ensure_schema(conn: sqlite3.Connection | None = None) -> None:
     owns_connection = conn is None
     if conn is None:
         conn = connect()
+    database_file, schema_version = _schema_state(conn)
+    if database_file and _ENSURED_SCHEMA_VERSIONS.get(database_file) == schema_version:
+        if owns_connection:
+            conn.close()
+        return
     cursor = conn.cursor()
     existing_tables = {
         row[0]
@@ -547,6 +574,11 @@ def ensure_schema(conn: sqlite3.Connection | None = None) -> None:
     _ensure_columns(cursor, "dicom_egress_queue", _DICOM_EGRESS_QUEUE_COLUMNS)
     _ensure_columns(cursor, "resource_monitor_samples", _RESOURCE_MONITOR_SAMPLE_COLUMNS)
     _ensure_columns(cursor, "study_handoff_state", _STUDY_HANDOFF_COLUMNS)
+    _ensure_case_id_column(cursor)
+    _ensure_dicom_metadata_revision(cursor)
+    # Same name as database/schema.sql so either creation path yields one
+    # index; the patient list reads dicom_metadata in StudyDate DESC order.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_study_date ON dicom_metadata(StudyDate)")
     cursor.execute(
         """
         CREATE INDEX IF NOT EXISTS idx_dicom_metadata_l1_hu_mean
@@ -560,6 +592,8 @@ def ensure_schema(conn: sqlite3.Connection | None = None) -> None:
         """
     )
     conn.commit()
+    if database_file:
+        _ENSURED_SCHEMA_VERSIONS[database_file] = _schema_state(conn)[1]
     if owns_connection:
         conn.close()
 
@@ -575,6 +609,61 @@ def _ensure_columns(cursor: sqlite3.Cursor, table_name: str, columns: dict[str,
         cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {name} {definition}")
 
 
+def _ensure_case_id_column(cursor: sqlite3.Cursor) -> None:
+    """Expose ``IdJson.CaseID`` as an indexed virtual column for case lookups."""
+    # table_info hides generated columns; table_xinfo lists them.
+    existing = {
+        row[1]
+        for row in cursor.execute("PRAGMA table_xinfo(dicom_metadata)").fetchall()
+    }
+    if "CaseID" not in existing:
+        try:
+            cursor.execute(
+                f"ALTER TABLE dicom_metadata ADD COLUMN CaseID {_CASE_ID_COLUMN_DEFINITION}"
+            )
+        except sqlite3.OperationalError as exc:
+            raise RuntimeError(
+                "Heimdallr requires SQLite 3.31+ with JSON1 (generated columns and json_extract); "
+                f"linked SQLite {sqlite3.sqlite_version} could not add dicom_metadata.CaseID: {exc}"
+            ) from exc
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dicom_metadata_case_id ON dicom_metadata(CaseID)"
+    )
+
+
+def _ensure_dicom_metadata_revision(cursor: sqlite3.Cursor) -> None:
+    """Keep a counter that moves on every dicom_metadata write.
+
+    Readers that cache data derived from the table (the patient list) compare
+    this single row instead of rescanning the table.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS dicom_metadata_revision (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            revision INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute("INSERT OR IGNORE INTO dicom_metadata_revision (id, revision) VALUES (1, 0)")
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_dicom_metadata_revision_{event.lower()}
+            AFTER {event} ON dicom_metadata
+            BEGIN
+                UPDATE dicom_metadata_revision SET revision = revision + 1 WHERE id = 1;
+            END
+            """
+        )
+
+
+def get_dicom_metadata_revision(conn: sqlite3.Connection) -> int:
+    ensure_schema(conn)
+    row = conn.execute("SELECT revision FROM dicom_metadata_revision WHERE id = 1").fetchone()
+    return int(row[0]) if row else 0
+
+
 def _to_optional_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -680,6 +769,7 @@ def upsert_study_metadata(conn: sqlite3.Connection, metadata: dict[str, Any]) ->
             CallingAET = COALESCE(NULLIF(excluded.CallingAET, ''), dicom_metadata.CallingAET),
             RemoteIP = COALESCE(NULLIF(excluded.RemoteIP, ''), dicom_metadata.RemoteIP),
             JsonDump = excluded.JsonDump,
+            FileSizeBytes = NULL,
             ArtifactsPurged = 0,
             ArtifactsPurgedAt = NULL,
             ProcessedAt = excluded.ProcessedAt
@@ -2352,7 +2442,13 @@ def update_full_dicom_metadata(conn: sqlite3.Connection, study_uid: str, full_me
     conn.commit()
 
 
-def update_id_json(conn: sqlite3.Connection, study_uid: str, metadata: dict[str, Any]) -> None:
+def update_id_json(
+    conn: sqlite3.Connection,
+    study_uid: str,
+    metadata: dict[str, Any],
+    *,
+    metadata_json: str | None = None,
+) -> None:
     conn.execute(
         """
         UPDATE dicom_metadata
@@ -2361,7 +2457,22 @@ def update_id_json(conn: sqlite3.Connection, study_uid: str, metadata: dict[str,
             Height = COALESCE(?, Height)
         WHERE StudyInstanceUID = ?
         """,
-        (json.dumps(metadata), metadata.get("Weight"), metadata.get("Height"), study_uid),
+        (
+            metadata_json if metadata_json is not None else json.dumps(metadata),
+            metadata.get("Weight"),
+            metadata.get("Height"),
+            study_uid,
+        ),
+    )
+    conn.commit()
+
+
+def update_file_size(conn: sqlite3.Connection, study_uid: str, file_size_bytes: int) -> None:
+    """Record the canonical NIfTI size so the patient list need not stat it."""
+    ensure_schema(conn)
+    conn.execute(
+        "UPDATE dicom_metadata SET FileSizeBytes = ? WHERE StudyInstanceUID = ?",
+        (int(file_size_bytes), study_uid),
     )
     conn.commit()
 
@@ -2445,21 +2556,30 @@ def update_segmentation_signature(
     conn.commit()
 
 
-def update_metrics_completion(
+def record_metrics_completion(
     conn: sqlite3.Connection,
     study_uid: str,
+    metadata: dict[str, Any],
     *,
     profile_name: str,
+    metadata_json: str | None = None,
 ) -> None:
+    """Persist the final id.json and metrics completion in a single UPDATE."""
     ensure_schema(conn)
     conn.execute(
         """
         UPDATE dicom_metadata
-        SET MetricsProfile = ?,
+        SET IdJson = ?,
+            Weight = COALESCE(?, Weight),
+            Height = COALESCE(?, Height),
+            MetricsProfile = ?,
             MetricsCompletedAt = ?
         WHERE StudyInstanceUID = ?
         """,
         (
+            metadata_json if metadata_json is not None else json.dumps(metadata),
+            metadata.get("Weight"),
+            metadata.get("Height"),
             str(profile_name),
             _now_local_timestamp(),
             study_uid,
@@ -2482,7 +2602,34 @@ def update_study_biometrics(
     conn.commit()
 
 
-def update_calculation_results(conn: sqlite3.Connection, study_uid: str, results: dict[str, Any]) -> None:
+def patch_id_json_biometrics(
+    conn: sqlite3.Connection,
+    study_uid: str,
+    *,
+    weight: float,
+    height: float,
+) -> None:
+    """Set Weight/Height columns and patch the same keys inside IdJson."""
+    conn.execute(
+        """
+        UPDATE dicom_metadata
+        SET Weight = ?,
+            Height = ?,
+            IdJson = json_set(COALESCE(NULLIF(IdJson, ''), '{}'), '$.Weight', ?, '$.Height', ?)
+        WHERE StudyInstanceUID = ?
+        """,
+        (weight, height, weight, height, study_uid),
+    )
+    conn.commit()
+
+
+def update_calculation_results(
+    conn: sqlite3.Connection,
+    study_uid: str,
+    results: dict[str, Any],
+    *,
+    results_json: str | None = None,
+) -> None:
     ensure_schema(conn)
     materialized = _extract_bone_health_materialized_fields(results)
     conn.execute(
@@ -2495,7 +2642,7 @@ def update_calculation_results(conn: sqlite3.Connection, study_uid: str, results
         WHERE StudyInstanceUID = ?
         """,
         (
-            json.dumps(results),
+            results_json if results_json is not None else json.dumps(results),
             materialized["BoneHealthL1TrabecularHuMean"],
             materialized["BoneHealthL1Classification"],
             materialized["BoneHealthL1QcPass"],
@@ -2516,86 +2663,129 @@ def backfill_materialized_calculation_results(conn: sqlite3.Connection) -> int:
         """
     ).fetchall()
 
-    updated = 0
+    updates = []
     for row in rows:
         try:
             results = json.loads(row["CalculationResults"])
         except Exception:
             continue
         materialized = _extract_bone_health_materialized_fields(results)
-        conn.execute(
-            """
-            UPDATE dicom_metadata
-            SET BoneHealthL1TrabecularHuMean = ?,
-                BoneHealthL1Classification = ?,
-                BoneHealthL1QcPass = ?
-            WHERE StudyInstanceUID = ?
-            """,
+        updates.append(
             (
                 materialized["BoneHealthL1TrabecularHuMean"],
                 materialized["BoneHealthL1Classification"],
                 materialized["BoneHealthL1QcPass"],
                 row["StudyInstanceUID"],
-            ),
+            )
         )
-        updated += 1
+    conn.executemany(
+        """
+        UPDATE dicom_metadata
+        SET BoneHealthL1TrabecularHuMean = ?,
+            BoneHealthL1Classification = ?,
+            BoneHealthL1QcPass = ?
+        WHERE StudyInstanceUID = ?
+        """,
+        updates,
+    )
     conn.commit()
-    return updated
+    return len(updates)
+
+
+def _json_field(column: str, path: str, json_type: str | None = None) -> str:
+    condition = f"json_valid({column})"
+    if json_type is not None:
+        condition += f" AND json_type({column}, '{path}') = '{json_type}'"
+    return f"CASE WHEN {condition} THEN json_extract({column}, '{path}') END"
+
+
+# IdJson/CalculationResults fields the patient list renders, extracted in SQL so
+# the full documents are never decoded in Python.
+_PATIENT_LIST_JSON_FIELDS = {
+    "IdPatientName": ("IdJson", "$.PatientName"),
+    "IdPatientID": ("IdJson", "$.PatientID"),
+    "IdPatientBirthDate": ("IdJson", "$.PatientBirthDate"),
+    "IdStudyDate": ("IdJson", "$.StudyDate"),
+    "IdAccessionNumber": ("IdJson", "$.AccessionNumber"),
+    "IdModality": ("IdJson", "$.Modality"),
+    "SegmentationElapsedTime": ("IdJson", "$.Pipeline.segmentation_elapsed_time"),
+    "ProcessingElapsedTime": ("IdJson", "$.Pipeline.processing_elapsed_time"),
+    "PipelineElapsedTime": ("IdJson", "$.Pipeline.elapsed_time"),
+    "PrepareElapsedTime": ("IdJson", "$.Pipeline.prepare_elapsed_time"),
+    "HemorrhageVolCm3": ("CalculationResults", "$.hemorrhage_vol_cm3"),
+    # Arrays come back as JSON text; the type guard keeps json.loads safe.
+    "BodyRegionsJson": ("CalculationResults", "$.body_regions", "array"),
+}
+
+
+def _patient_list_query() -> str:
+    json_fields = ",\n".join(
+        f"            {_json_field(*field)} AS {alias}"
+        for alias, field in _PATIENT_LIST_JSON_FIELDS.items()
+    )
+    return f"""
+        SELECT
+            StudyInstanceUID,
+            PatientName,
+            PatientID,
+            PatientBirthDate,
+            AccessionNumber,
+            StudyDate,
+            Modality,
+            CaseID,
+            FileSizeBytes,
+            ArtifactsPurged,
+            ArtifactsPurgedAt,
+            COALESCE(IdJson, '') != '' AS HasIdJson,
+            json_valid(IdJson) AS IdJsonValid,
+            COALESCE(CalculationResults, '') != '' AS HasCalculationResults,
+            json_valid(CalculationResults) AS CalculationResultsValid,
+            CASE
+                WHEN json_valid(CalculationResults)
+                    AND json_type(CalculationResults) = 'object'
+                THEN (SELECT COUNT(*) FROM json_each(CalculationResults))
+                ELSE 0
+            END AS ResultsKeyCount,
+{json_fields}
+        FROM dicom_metadata
+        ORDER BY StudyDate DESC
+        """
+
 
+def list_patient_rows(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Return a cursor over one projected row per study for the patient list.
 
-def list_patient_rows(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    Besides the plain columns, each row carries the rendered JSON fields
+    (see ``_PATIENT_LIST_JSON_FIELDS``), ``ResultsKeyCount`` for non-empty
+    results, and ``IdJsonValid``/``CalculationResultsValid`` so callers can
+    report malformed documents. Rows are streamed from the cursor rather than
+    materialized up front; iterate it once.
+    """
     ensure_schema(conn)
-    return conn.execute("SELECT * FROM dicom_metadata ORDER BY StudyDate DESC").fetchall()
+    return conn.execute(_patient_list_query())
 
 
 def find_case_row_by_case_id(conn: sqlite3.Connection, case_id: str) -> sqlite3.Row | None:
     ensure_schema(conn)
-    try:
-        row = conn.execute(
-            """
-            SELECT
-                StudyInstanceUID,
-                IdJson,
-                PatientID,
-                PatientBirthDate,
-                Weight,
-                Height,
-                PatientSex,
-                CalculationResults,
-                SMI,
-                ArtifactsPurged,
-                ArtifactsPurgedAt
-            FROM dicom_metadata
-            WHERE json_extract(IdJson, '$.CaseID') = ?
-            """,
-            (case_id,),
-        ).fetchone()
-        if row:
-            return row
-    except Exception:
-        pass
-
-    for row in conn.execute(
+    return conn.execute(
         """
         SELECT
-                StudyInstanceUID,
-                IdJson,
-                PatientID,
-                PatientBirthDate,
-                Weight,
-                Height,
+            StudyInstanceUID,
+            IdJson,
+            PatientID,
+            PatientBirthDate,
+            Weight,
+            Height,
             PatientSex,
             CalculationResults,
             SMI,
             ArtifactsPurged,
             ArtifactsPurgedAt
         FROM dicom_metadata
-        """
-    ).fetchall():
-        metadata = json.loads(row["IdJson"]) if row["IdJson"] else {}
-        if metadata.get("CaseID") == case_id:
-            return row
-    return None
+        WHERE CaseID = ?
+        """,
+        (case_id,),
+    ).fetchone()
 
 
 def list_protected_case_ids(conn: sqlite3.Connection) -> set[str]:
@@ -2744,37 +2934,41 @@ def persist_qc_inventory(
     ensure_schema(conn)
     conn.execute("DELETE FROM qc_series WHERE analysis_id = ?", (analysis_id,))
     conn.execute("DELETE FROM qc_acquisitions WHERE analysis_id = ?", (analysis_id,))
-    for item in acquisitions:
-        conn.execute(
-            """
-            INSERT INTO qc_acquisitions (
-                analysis_id, acquisition_id, representative_series_uid,
-                segmentation_status, payload_json
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
+    conn.executemany(
+        """
+        INSERT INTO qc_acquisitions (
+            analysis_id, acquisition_id, representative_series_uid,
+            segmentation_status, payload_json
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        [
             (
                 analysis_id,
                 item["acquisition_id"],
                 item.get("representative_series_uid"),
                 item.get("segmentation_status", "not_segmented"),
                 json.dumps(item, sort_keys=True),
-            ),
-        )
-    for item in series:
-        conn.execute(
-            """
-            INSERT INTO qc_series (
-                analysis_id, series_uid, acquisition_id, segmentation_status, payload_json
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
+            )
+            for item in acquisitions
+        ],
+    )
+    conn.executemany(
+        """
+        INSERT INTO qc_series (
+            analysis_id, series_uid, acquisition_id, segmentation_status, payload_json
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        [
             (
                 analysis_id,
                 item["series_uid"],
                 item.get("acquisition_id"),
                 item.get("segmentation_status", "not_segmented"),
                 json.dumps(item, sort_keys=True),
-            ),
-        )
+            )
+            for item in series
+        ],
+    )
     conn.execute(
         "UPDATE qc_study_analyses SET status = 'segmentation_pending', error = NULL WHERE analysis_id = ?",
         (analysis_id,),
@@ -2957,21 +3151,23 @@ def complete_qc_segmentation(
         "DELETE FROM qc_anatomy_evidence WHERE analysis_id = ? AND acquisition_id = ?",
         (row["analysis_id"], row["acquisition_id"]),
     )
-    for item in anatomy:
-        conn.execute(
-            """
-            INSERT INTO qc_anatomy_evidence (
-                analysis_id, acquisition_id, anatomy_key, state, payload_json
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
+    conn.executemany(
+        """
+        INSERT INTO qc_anatomy_evidence (
+            analysis_id, acquisition_id, anatomy_key, state, payload_json
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        [
             (
                 row["analysis_id"],
                 row["acquisition_id"],
                 item["anatomy_key"],
                 item["state"],
                 json.dumps(item, sort_keys=True),
-            ),
-        )
+            )
+            for item in anatomy
+        ],
+    )
     conn.execute(
         "UPDATE qc_study_analyses SET model_versions_json = ? WHERE analysis_id = ?",
         (json.dumps(model_versions, sort_keys=True), row["analysis_id"]),
@@ -3060,21 +3256,24 @@ def update_qc_analysis_summary(
         "DELETE FROM qc_consolidated_provenance WHERE analysis_id = ?",
         (analysis_id,),
     )
-    for anatomy_key, payload in sorted(coverage.get("anatomies", {}).items()):
-        conn.execute(
-            """
-            INSERT INTO qc_consolidated_provenance (
-                analysis_id, anatomy_key, state, payload_json, updated_at
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
+    updated_at = _now_local_timestamp()
+    conn.executemany(
+        """
+        INSERT INTO qc_consolidated_provenance (
+            analysis_id, anatomy_key, state, payload_json, updated_at
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        [
             (
                 analysis_id,
                 anatomy_key,
                 str(payload.get("state") or "unknown"),
                 json.dumps(payload, sort_keys=True),
-                _now_local_timestamp(),
-            ),
-        )
+                updated_at,
+            )
+            for anatomy_key, payload in sorted(coverage.get("anatomies", {}).items())
+        ],
+    )
     conn.execute(
         """
         UPDATE qc_study_analyses
@@ -3172,14 +3371,15 @@ def mark_qc_selected_series(conn: sqlite3.Connection, study_uid: str, series_uid
     ).fetchone()
     if not analysis:
         return
-    rows = list_qc_series(conn, str(analysis["analysis_id"]))
-    for row in rows:
+    updates = []
+    for row in list_qc_series(conn, str(analysis["analysis_id"])):
         payload = json.loads(row["payload_json"])
         payload["selected_for_metrics"] = str(row["series_uid"]) == str(series_uid)
-        conn.execute(
-            "UPDATE qc_series SET payload_json = ? WHERE analysis_id = ? AND series_uid = ?",
-            (json.dumps(payload, sort_keys=True), row["analysis_id"], row["series_uid"]),
-        )
+        updates.append((json.dumps(payload, sort_keys=True), row["analysis_id"], row["series_uid"]))
+    conn.executemany(
+        "UPDATE qc_series SET payload_json = ? WHERE analysis_id = ? AND series_uid = ?",
+        updates,
+    )
     conn.commit()
 
 
@@ -3239,7 +3439,8 @@ def purge_case_records(conn: sqlite3.Connection, case_id: str) -> str | None:
             """
             UPDATE dicom_metadata
             SET ArtifactsPurged = 1,
-                ArtifactsPurgedAt = ?
+                ArtifactsPurgedAt = ?,
+                FileSizeBytes = NULL
             WHERE StudyInstanceUID = ?
             """,
             (_now_local_timestamp(), study_uid),
@@ -9,6 +9,26 @@ BASE_DIR = Path("/home/rodrigo/Heimdallr")
 OUTPUT_DIR = BASE_DIR / "output"
 DB_PATH = BASE_DIR / "database" / "dicom.db"
 
+SELECT_BATCH_SIZE = 500
+
+
+def fetch_metadata_rows(cursor, study_uids):
+    """Return DicomMetadata/JsonDump rows keyed by StudyInstanceUID, batched."""
+    rows = {}
+    unique_uids = list(dict.fromkeys(study_uids))
+    for start in range(0, len(unique_uids), SELECT_BATCH_SIZE):
+        batch = unique_uids[start:start + SELECT_BATCH_SIZE]
+        placeholders = ",".join("?" for _ in batch)
+        cursor.execute(
+            "SELECT StudyInstanceUID, DicomMetadata, JsonDump FROM dicom_metadata "
+            f"WHERE StudyInstanceUID IN ({placeholders})",
+            batch,
+        )
+        for study_uid, dicom_meta_str, json_dump_str in cursor.fetchall():
+            rows[study_uid] = (dicom_meta_str, json_dump_str)
+    return rows
+
+
 def main():
     if not DB_PATH.exists():
         print(f"Database not found at {DB_PATH}")
@@ -19,12 +39,12 @@ def main():
 
     updated_cases = 0
 
+    cases = []
     for case_dir in OUTPUT_DIR.iterdir():
         if not case_dir.is_dir():
             continue
 
         id_json_path = case_dir / "id.json"
-        metrics_json_path = case_dir / "resultados.json"
 
         if not id_json_path.exists():
             continue
@@ -35,10 +55,15 @@ def main():
         study_uid = id_data.get("StudyInstanceUID")
         if not study_uid:
             continue
+        cases.append((case_dir, id_data, study_uid))
+
+    # Fetch KVP sources from Database in a few batched queries
+    metadata_rows = fetch_metadata_rows(c, [study_uid for _, _, study_uid in cases])
 
-        # Fetch KVP from Database
-        c.execute("SELECT DicomMetadata, JsonDump FROM dicom_metadata WHERE StudyInstanceUID = ?", (study_uid,))
-        row = c.fetchone()
+    for case_dir, id_data, study_uid in cases:
+        id_json_path = case_dir / "id.json"
+        metrics_json_path = case_dir / "resultados.json"
+        row = metadata_rows.get(study_uid)
         
         kvp_val = "Unknown"
         if row:
@@ -28,6 +28,28 @@ from pydicom.errors import InvalidDicomError
 
 
 TEXT_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
+DEFAULT_OCR_MAX_SHORT_EDGE = 1024
+# Only the elements needed to decode and window pixels; everything else in the
+# dataset (private blobs, sequences, overlays) is skipped while parsing.
+OCR_DICOM_TAGS = (
+    "Rows",
+    "Columns",
+    "SamplesPerPixel",
+    "PhotometricInterpretation",
+    "PlanarConfiguration",
+    "NumberOfFrames",
+    "BitsAllocated",
+    "BitsStored",
+    "HighBit",
+    "PixelRepresentation",
+    "RescaleSlope",
+    "RescaleIntercept",
+    "WindowCenter",
+    "WindowWidth",
+    "ExtendedOffsetTable",
+    "ExtendedOffsetTableLengths",
+    "PixelData",
+)
 
 
 @dataclass(frozen=True)
@@ -89,33 +111,62 @@ def _first_numeric(value: Any) -> float | None:
         return None
 
 
-def _windowed_uint8(frame: np.ndarray, ds: pydicom.Dataset) -> np.ndarray:
-    arr = np.asarray(frame, dtype=np.float32)
-    slope = _first_numeric(getattr(ds, "RescaleSlope", None))
-    intercept = _first_numeric(getattr(ds, "RescaleIntercept", None))
+def _rescale(values: np.ndarray, slope: float | None, intercept: float | None) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.float32)
     if slope is not None:
         arr = arr * slope
     if intercept is not None:
         arr = arr + intercept
+    return arr
 
+
+def _window_bounds(
+    frame: np.ndarray,
+    ds: pydicom.Dataset,
+    slope: float | None,
+    intercept: float | None,
+) -> tuple[float, float]:
     center = _first_numeric(getattr(ds, "WindowCenter", None))
     width = _first_numeric(getattr(ds, "WindowWidth", None))
     if center is not None and width is not None and width > 0:
-        low = center - width / 2.0
-        high = center + width / 2.0
-    else:
-        low, high = np.percentile(arr, [0.5, 99.5])
-        if float(high) <= float(low):
-            low = float(np.min(arr))
-            high = float(np.max(arr))
-    if float(high) <= float(low):
-        return np.zeros(arr.shape, dtype=np.uint8)
-    arr = np.clip((arr - low) / (high - low), 0.0, 1.0)
-    if str(getattr(ds, "PhotometricInterpretation", "")).upper() == "MONOCHROME1":
+        return center - width / 2.0, center + width / 2.0
+    # Rescale is affine, so the symmetric percentiles of the raw frame map onto
+    # the percentiles of the rescaled frame without materializing it.
+    raw_low, raw_high = np.percentile(frame, [0.5, 99.5])
+    if float(raw_high) <= float(raw_low):
+        raw_low, raw_high = np.min(frame), np.max(frame)
+    bounds = _rescale(np.array([raw_low, raw_high]), slope, intercept)
+    return float(bounds.min()), float(bounds.max())
+
+
+def _apply_window(values: np.ndarray, low: float, high: float, *, invert: bool) -> np.ndarray:
+    arr = np.clip((values - low) / (high - low), 0.0, 1.0)
+    if invert:
         arr = 1.0 - arr
     return np.asarray(arr * 255.0, dtype=np.uint8)
 
 
+def _windowed_uint8(frame: np.ndarray, ds: pydicom.Dataset) -> np.ndarray:
+    slope = _first_numeric(getattr(ds, "RescaleSlope", None))
+    intercept = _first_numeric(getattr(ds, "RescaleIntercept", None))
+    low, high = _window_bounds(frame, ds, slope, intercept)
+    if float(high) <= float(low):
+        return np.zeros(frame.shape, dtype=np.uint8)
+    invert = str(getattr(ds, "PhotometricInterpretation", "")).upper() == "MONOCHROME1"
+
+    if frame.dtype.kind in "iu" and frame.dtype.itemsize <= 2:
+        # Stored pixels span at most 65536 values: window each one once and
+        # index the frame, instead of several float passes over every pixel.
+        offset = min(int(frame.min()), 0)
+        values = np.arange(offset, int(frame.max()) + 1, dtype=np.int32)
+        lut = _apply_window(_rescale(values, slope, intercept), low, high, invert=invert)
+        if offset == 0:
+            return lut[frame]
+        return lut[frame.astype(np.int32) - offset]
+
+    return _apply_window(_rescale(frame, slope, intercept), low, high, invert=invert)
+
+
 def frames_for_ocr(ds: pydicom.Dataset, *, max_frames_per_instance: int) -> list[np.ndarray]:
     pixels = ds.pixel_array
     if pixels.ndim == 2:
@@ -133,16 +184,28 @@ def frames_for_ocr(ds: pydicom.Dataset, *, max_frames_per_instance: int) -> list
     return []
 
 
+def downscale_for_ocr(image: Image.Image, *, max_short_edge: int) -> Image.Image:
+    """Shrink large frames so the short edge is at most ``max_short_edge`` pixels."""
+    short_edge = min(image.size)
+    if max_short_edge <= 0 or short_edge <= max_short_edge:
+        return image
+    scale = max_short_edge / short_edge
+    width, height = image.size
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(size, Image.BILINEAR)
+
+
 def run_tesseract(
     image: np.ndarray,
     *,
     tesseract_bin: str,
     psm: int,
     timeout_seconds: float,
+    max_short_edge: int = DEFAULT_OCR_MAX_SHORT_EDGE,
 ) -> str:
     with tempfile.TemporaryDirectory() as tmpdir:
         image_path = Path(tmpdir) / "frame.png"
-        Image.fromarray(image).save(image_path)
+        downscale_for_ocr(Image.fromarray(image), max_short_edge=max_short_edge).save(image_path)
         result = subprocess.run(
             [
                 tesseract_bin,
@@ -172,6 +235,7 @@ def verify_source(
     psm: int,
     timeout_seconds: float,
     include_text: bool,
+    max_short_edge: int = DEFAULT_OCR_MAX_SHORT_EDGE,
 ) -> dict[str, Any]:
     findings: list[dict[str, Any]] = []
     dicom_instances = 0
@@ -184,7 +248,7 @@ def verify_source(
         if max_instances is not None and dicom_instances >= max_instances:
             break
         try:
-            ds = pydicom.dcmread(io.BytesIO(payload.raw), force=True)
+            ds = pydicom.dcmread(io.BytesIO(payload.raw), force=True, specific_tags=list(OCR_DICOM_TAGS))
         except InvalidDicomError:
             skipped_non_dicom += 1
             continue
@@ -208,6 +272,7 @@ def verify_source(
                 tesseract_bin=tesseract_bin,
                 psm=psm,
                 timeout_seconds=timeout_seconds,
+                max_short_edge=max_short_edge,
             )
             if not has_ocr_text(text, min_text_chars=min_text_chars):
                 continue
@@ -268,6 +333,12 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--psm", type=int, default=6, help="Tesseract page segmentation mode.")
     parser.add_argument("--timeout-seconds", type=float, default=15.0)
+    parser.add_argument(
+        "--max-short-edge",
+        type=int,
+        default=DEFAULT_OCR_MAX_SHORT_EDGE,
+        help="Downscale frames whose short edge exceeds this many pixels before OCR; 0 disables.",
+    )
     parser.add_argument(
         "--include-text",
         action="store_true",
@@ -299,6 +370,7 @@ def main() -> int:
         psm=args.psm,
         timeout_seconds=args.timeout_seconds,
         include_text=args.include_text,
+        max_short_edge=args.max_short_edge,
     )
     if args.report:
         args.report.parent.mkdir(parents=True, exist_ok=True)
@@ -94,6 +94,22 @@ class TestAppendicularExclusion(unittest.TestCase):
             self.assertEqual(audit["projection"]["slice_start"], 2)
             self.assertEqual(audit["projection"]["slice_end_exclusive"], 9)
 
+    def test_load_mask_slice_skips_mask_with_mismatched_geometry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            artifacts_dir = Path(tmp) / "artifacts"
+            mask = np.ones((8, 8, 10), dtype=np.float32)
+            write_nifti(artifacts_dir / "total" / "humerus_right.nii.gz", mask)
+
+            projected, audit = load_upper_appendicular_mask_slice(
+                artifacts_dir,
+                reference_shape=(8, 8, 12),
+                slice_idx=5,
+            )
+
+            self.assertFalse(projected.any())
+            self.assertEqual(audit["source_masks"], [])
+            self.assertEqual(audit["skipped_masks"], {"humerus_right": "shape_mismatch"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,7 @@ import nibabel as nib
 import numpy as np
 
 from heimdallr.metrics.analysis.bone_health import (
+    _keep_largest_component_3d,
     build_bone_health_qc_flags,
     build_opportunistic_osteoporosis_composite,
     calculate_mask_hu_statistics,
@@ -107,6 +108,18 @@ class TestBoneHealthHelpers(unittest.TestCase):
         self.assertGreater(profile[2]["mean_hu"], profile[0]["mean_hu"])
         self.assertEqual(profile[5]["voxel_count"], 0)
 
+    def test_keep_largest_component_3d_selects_biggest_island(self):
+        mask = np.zeros((10, 10, 10), dtype=bool)
+        mask[0:2, 0:2, 0:2] = True
+        mask[5:9, 5:9, 5:9] = True
+        mask[0, 9, 9] = True
+
+        largest = _keep_largest_component_3d(mask)
+
+        self.assertEqual(int(np.count_nonzero(largest)), 64)
+        self.assertTrue(largest[6, 6, 6])
+        self.assertFalse(largest[0, 0, 0])
+
     def test_fracture_screen_detects_height_asymmetry(self):
         mask = np.zeros((12, 12, 12), dtype=bool)
 
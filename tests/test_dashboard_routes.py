@@ -0,0 +1,34 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from heimdallr.control_plane.app import create_app
+from heimdallr.shared import settings
+
+
+class TestDashboardRoutes(unittest.TestCase):
+    def test_dashboard_serves_index_file_and_falls_back_when_missing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            static_dir = Path(tmpdir) / "static"
+            static_dir.mkdir()
+            (static_dir / "index.html").write_text("<html>Heimdallr dashboard</html>", encoding="utf-8")
+
+            with patch.object(settings, "STATIC_DIR", static_dir):
+                client = TestClient(create_app())
+                response = client.get("/")
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.headers["content-type"].startswith("text/html"))
+                self.assertIn("last-modified", response.headers)
+                self.assertEqual(response.text, "<html>Heimdallr dashboard</html>")
+
+                (static_dir / "index.html").unlink()
+                fallback = client.get("/")
+                self.assertEqual(fallback.status_code, 200)
+                self.assertIn("Dashboard not found", fallback.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
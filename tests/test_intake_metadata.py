@@ -1,6 +1,7 @@
 import sqlite3
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -104,6 +105,50 @@ class TestIntakeMetadata(unittest.TestCase):
             self.assertNotIn("1.2.3", listener.studies)
             self.assertEqual(len(list(staging.glob("*.zip"))), 1)
 
+    def test_scan_and_flush_archives_failed_upload_without_leaving_work_zip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            incoming = base / "incoming"
+            failed = base / "failed"
+            staging = base / "staging"
+            study_dir = incoming / "1.2.3"
+            (study_dir / "series").mkdir(parents=True, exist_ok=True)
+            (study_dir / "series" / "one.dcm").write_bytes(b"dcm")
+
+            listener = gateway.HeimdallrDicomListener(
+                incoming_dir=incoming,
+                failed_dir=failed,
+                state_dir=base / "state",
+                idle_seconds=600,
+                upload_url="http://127.0.0.1/upload",
+                upload_token=None,
+                upload_timeout=30,
+                upload_retries=1,
+                upload_backoff=0,
+                handoff_mode="http_upload",
+                upload_staging_dir=staging,
+            )
+            current_ts = gateway.now()
+            listener.studies["1.2.3"] = gateway.StudyState(
+                study_uid="1.2.3",
+                path=study_dir,
+                first_update_ts=current_ts - 5,
+                last_update_ts=current_ts,
+                calling_aet="SRC",
+                remote_ip="10.0.0.1",
+                instance_count=1,
+            )
+
+            with patch.object(gateway, "upload_zip", side_effect=RuntimeError("offline")):
+                listener.scan_and_flush(force=True)
+
+            failed_zips = list(failed.glob("*.zip"))
+            self.assertEqual(len(failed_zips), 1)
+            with zipfile.ZipFile(failed_zips[0]) as zf:
+                self.assertIn("series/one.dcm", zf.namelist())
+            self.assertEqual(list(staging.iterdir()), [])
+            self.assertTrue(study_dir.exists())
+
     def test_upsert_study_metadata_preserves_intake_columns(self):
         conn = sqlite3.connect(":memory:")
         conn.row_factory = sqlite3.Row
@@ -547,7 +547,7 @@ class TestIntegrationDeliveryPackageAndWorker(unittest.TestCase):
             package_path.write_bytes(b"zip")
             manifest = {"package_name": "package.zip"}
 
-            with patch("heimdallr.integration.delivery.worker.requests.request", return_value=response) as request:
+            with patch.object(worker._HTTP_SESSION, "request", return_value=response) as request:
                 returned = worker.deliver_case_package(
                     callback_url="http://receiver.local/callback",
                     http_method="POST",
@@ -571,7 +571,7 @@ class TestIntegrationDeliveryPackageAndWorker(unittest.TestCase):
             "job_id": "job-failed",
         }
 
-        with patch("heimdallr.integration.delivery.worker.requests.request", return_value=response) as request:
+        with patch.object(worker._HTTP_SESSION, "request", return_value=response) as request:
             returned = worker.deliver_callback(
                 callback_url="http://receiver.local/callback",
                 http_method="POST",
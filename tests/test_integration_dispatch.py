@@ -132,7 +132,7 @@ class TestIntegrationDispatchStoreAndWorker(unittest.TestCase):
     def test_dispatch_integration_event_posts_json_and_accepts_202(self):
         response = Mock(status_code=202, text="")
 
-        with patch("heimdallr.integration.dispatch.worker.requests.request", return_value=response) as request:
+        with patch.object(worker._HTTP_SESSION, "request", return_value=response) as request:
             returned = worker.dispatch_integration_event(
                 destination_url="http://asha.local/webhooks/patient-identified",
                 http_method="POST",
@@ -145,15 +145,15 @@ class TestIntegrationDispatchStoreAndWorker(unittest.TestCase):
         request.assert_called_once_with(
             "POST",
             "http://asha.local/webhooks/patient-identified",
-            json={"event_type": "patient_identified"},
-            headers={"Authorization": "Bearer test"},
+            data=b'{"event_type": "patient_identified"}',
+            headers={"Authorization": "Bearer test", "Content-Type": "application/json"},
             timeout=10,
         )
 
     def test_dispatch_integration_event_raises_on_non_2xx(self):
         response = Mock(status_code=503, text="service unavailable")
 
-        with patch("heimdallr.integration.dispatch.worker.requests.request", return_value=response):
+        with patch.object(worker._HTTP_SESSION, "request", return_value=response):
             with self.assertRaises(RuntimeError) as ctx:
                 worker.dispatch_integration_event(
                     destination_url="http://asha.local/webhooks/patient-identified",
@@ -141,6 +141,23 @@ class TestHeadCompleteQcJob(unittest.TestCase):
         self.assertFalse(status["complete"])
         self.assertIn("z_min", status["touched_bounds"])
 
+    def test_load_mask_reuses_cached_array_for_repeated_paths(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            mask_path = Path(tmp) / "brain.nii.gz"
+            data = np.zeros((6, 6, 6), dtype=np.uint8)
+            data[2:4, 2:4, 2:4] = 1
+            write_nifti(mask_path, data)
+            mask_cache = {}
+
+            first = head_complete_qc._load_mask(mask_path, mask_cache)
+            with patch.object(head_complete_qc.nib, "load") as load:
+                second = head_complete_qc._load_support_mask(mask_path, (6, 6, 6), mask_cache)
+
+            load.assert_not_called()
+            self.assertIs(first, mask_cache[mask_path])
+            self.assertEqual(first.dtype, np.bool_)
+            self.assertEqual(int(np.count_nonzero(second)), 8)
+
     def test_job_validates_complete_head_and_writes_normalized_nifti(self):
         with tempfile.TemporaryDirectory() as tmp:
             tmp_path = Path(tmp)
@@ -720,6 +720,14 @@ class TestMetricsWorker(unittest.TestCase):
             starts[("parenchymal_organ_volumetry", "end")],
         )
 
+    def test_job_subprocess_env_defaults_numeric_threads_to_one(self):
+        with patch.dict("os.environ", {"PATH": "/usr/bin", "OMP_NUM_THREADS": "4"}, clear=True):
+            env = metrics_worker._job_subprocess_env()
+
+        self.assertEqual(env["OMP_NUM_THREADS"], "4")
+        self.assertEqual(env["OPENBLAS_NUM_THREADS"], "1")
+        self.assertEqual(env["MKL_NUM_THREADS"], "1")
+
     def test_segment_case_metrics_groups_secondary_capture_exports_when_configured(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -805,7 +813,7 @@ class TestMetricsWorker(unittest.TestCase):
                 patch("heimdallr.metrics.worker._enqueue_case_dicom_exports", return_value=2),
                 patch("heimdallr.metrics.worker.settings.ARTIFACTS_LOCALE", "en_US"),
                 patch("heimdallr.metrics.worker.db_connect") as mock_connect,
-                patch("heimdallr.metrics.worker.store.update_metrics_completion"),
+                patch("heimdallr.metrics.worker.store.record_metrics_completion") as mock_record_completion,
                 patch("heimdallr.metrics.worker.store.update_calculation_results"),
                 patch("heimdallr.metrics.worker.store.update_id_json"),
             ):
@@ -813,6 +821,7 @@ class TestMetricsWorker(unittest.TestCase):
                 ok = segment_case_metrics(case_dir)
 
             self.assertTrue(ok)
+            mock_record_completion.assert_called_once()
             first = pydicom.dcmread(str(first_path))
             second = pydicom.dcmread(str(second_path))
             self.assertEqual(first.SeriesInstanceUID, second.SeriesInstanceUID)
@@ -889,7 +898,7 @@ class TestMetricsWorker(unittest.TestCase):
                 patch("heimdallr.metrics.worker.build_artifact_instructions_secondary_capture", side_effect=fake_build_sc),
                 patch("heimdallr.metrics.worker.settings.ARTIFACTS_LOCALE", "en_US"),
                 patch("heimdallr.metrics.worker.db_connect") as mock_connect,
-                patch("heimdallr.metrics.worker.store.update_metrics_completion"),
+                patch("heimdallr.metrics.worker.store.record_metrics_completion") as mock_record_completion,
                 patch("heimdallr.metrics.worker.store.update_calculation_results"),
                 patch("heimdallr.metrics.worker.store.update_id_json"),
             ):
@@ -897,6 +906,7 @@ class TestMetricsWorker(unittest.TestCase):
                 ok = segment_case_metrics(case_dir)
 
             self.assertTrue(ok)
+            mock_record_completion.assert_called_once()
             self.assertTrue(pdf_path.exists())
             for path in sc_paths:
                 self.assertTrue(path.exists())
@@ -1010,7 +1020,7 @@ class TestMetricsWorker(unittest.TestCase):
                 patch("heimdallr.metrics.worker.create_encapsulated_pdf_dicom", side_effect=fake_create_dicom),
                 patch("heimdallr.metrics.worker.settings.ARTIFACTS_LOCALE", "en_US"),
                 patch("heimdallr.metrics.worker.db_connect") as mock_connect,
-                patch("heimdallr.metrics.worker.store.update_metrics_completion"),
+                patch("heimdallr.metrics.worker.store.record_metrics_completion") as mock_record_completion,
                 patch("heimdallr.metrics.worker.store.update_calculation_results"),
                 patch("heimdallr.metrics.worker.store.update_id_json"),
             ):
@@ -1018,6 +1028,7 @@ class TestMetricsWorker(unittest.TestCase):
                 ok = segment_case_metrics(case_dir)
 
             self.assertTrue(ok)
+            mock_record_completion.assert_called_once()
             self.assertTrue(pdf_path.exists())
             self.assertTrue(dicom_path.exists())
             enqueued_exports = enqueue_mock.call_args.args[2]
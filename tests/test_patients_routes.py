@@ -0,0 +1,376 @@
+import io
+import json
+import sqlite3
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from heimdallr.control_plane.app import create_app
+from heimdallr.control_plane.patient_service import parse_elapsed_seconds
+from heimdallr.shared import dependencies, settings, store
+from heimdallr.shared.schemas import PatientListResponse
+
+
+class TestPatientsRoutes(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        base = Path(self._tmpdir.name)
+        self.db_path = base / "dicom.db"
+        self.studies_dir = base / "studies"
+        self.studies_dir.mkdir()
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            store.ensure_schema(conn)
+        finally:
+            conn.close()
+        self._patches = [
+            patch.object(settings, "DB_PATH", self.db_path),
+            patch.object(settings, "STUDIES_DIR", self.studies_dir),
+        ]
+        for active_patch in self._patches:
+            active_patch.start()
+        self.client = TestClient(create_app())
+
+    def tearDown(self):
+        for active_patch in reversed(self._patches):
+            active_patch.stop()
+        self._tmpdir.cleanup()
+
+    def _insert_case(self, study_uid, id_json, **columns):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            fields = {"StudyInstanceUID": study_uid, "IdJson": id_json, **columns}
+            placeholders = ", ".join("?" for _ in fields)
+            conn.execute(
+                f"INSERT INTO dicom_metadata ({', '.join(fields)}) VALUES ({placeholders})",
+                tuple(fields.values()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_patient_list_renders_projected_columns(self):
+        self._insert_case(
+            "1.2.3",
+            json.dumps({"CaseID": "Case_1", "Pipeline": {"prepare_elapsed_time": "0:01:05"}}),
+            PatientName="Ann Smith",
+            StudyDate="20260101",
+            AccessionNumber="A1",
+            Modality="CT",
+            CalculationResults=json.dumps({"hemorrhage_vol_cm3": 2.0, "body_regions": ["head"]}),
+            DicomMetadata=json.dumps({"Large": "x" * 4096}),
+        )
+
+        response = self.client.get("/api/patients")
+
+        self.assertEqual(response.status_code, 200)
+        (patient,) = response.json()["patients"]
+        self.assertEqual(patient["case_id"], "Case_1")
+        self.assertEqual(patient["accession"], "A1")
+        self.assertEqual(patient["modality"], "CT")
+        self.assertEqual(patient["prepare_elapsed_seconds"], 65)
+        self.assertEqual(patient["body_regions"], ["head"])
+        self.assertTrue(patient["has_hemorrhage"])
+        self.assertFalse(patient["artifacts_purged"])
+
+    def test_patient_list_order_uses_study_date_index(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            plan = " ".join(
+                str(row[-1])
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {store._patient_list_query()}").fetchall()
+            )
+        finally:
+            conn.close()
+        self.assertIn("idx_study_date", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_patient_list_is_cached_until_dicom_metadata_changes(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1"}), PatientName="Ann Smith", Modality="CT")
+        self.assertEqual(self.client.get("/api/patients").json()["patients"][0]["modality"], "CT")
+
+        with (
+            patch.object(store, "list_patient_rows", side_effect=AssertionError("list rebuilt")),
+            patch.object(PatientListResponse, "model_dump_json", side_effect=AssertionError("list re-encoded")),
+        ):
+            self.assertEqual(self.client.get("/api/patients").json()["patients"][0]["modality"], "CT")
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("UPDATE dicom_metadata SET Modality = 'MR' WHERE StudyInstanceUID = '1.2.3'")
+            conn.commit()
+        finally:
+            conn.close()
+        self.assertEqual(self.client.get("/api/patients").json()["patients"][0]["modality"], "MR")
+
+    def test_patient_list_prefers_recorded_file_size_over_disk(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1"}), PatientName="Ann Smith")
+        self._insert_case("4.5.6", json.dumps({"CaseID": "Case_2"}), PatientName="Bob Jones")
+        derived_dir = self.studies_dir / "Case_2" / "derived"
+        derived_dir.mkdir(parents=True)
+        (derived_dir / "Case_2.nii.gz").write_bytes(b"0" * 2048)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            store.update_file_size(conn, "1.2.3", 4096)
+        finally:
+            conn.close()
+
+        response = self.client.get("/api/patients")
+
+        sizes = {patient["case_id"]: patient["file_size_bytes"] for patient in response.json()["patients"]}
+        self.assertEqual(sizes, {"Case_1": 4096, "Case_2": 2048})
+
+    def test_patient_list_tolerates_malformed_documents_and_reads_disk_results(self):
+        self._insert_case("1.2.3", "{not json", PatientName="Ann Smith", StudyDate="20260101", AccessionNumber="A1")
+        self._insert_case(
+            "4.5.6",
+            json.dumps({"CaseID": "Case_2"}),
+            PatientName="Bob Jones",
+            StudyDate="20260102",
+            CalculationResults=json.dumps({"body_regions": "abdomen"}),
+        )
+        results_dir = self.studies_dir / "Ann_20260101_A1" / "metadata"
+        results_dir.mkdir(parents=True)
+        (results_dir / "resultados.json").write_text(json.dumps({"body_regions": ["chest"]}))
+
+        response = self.client.get("/api/patients")
+
+        self.assertEqual(response.status_code, 200)
+        patients = {patient["case_id"]: patient for patient in response.json()["patients"]}
+        self.assertEqual(patients["Ann_20260101_A1"]["body_regions"], ["chest"])
+        self.assertTrue(patients["Ann_20260101_A1"]["has_results"])
+        self.assertEqual(patients["Case_2"]["body_regions"], [])
+        self.assertTrue(patients["Case_2"]["has_results"])
+
+    def test_db_dependency_reuses_connections_and_discards_open_transactions(self):
+        first = dependencies.get_db()
+        conn = next(first)
+        conn.execute("INSERT INTO dicom_metadata (StudyInstanceUID) VALUES ('uncommitted')")
+        with self.assertRaises(StopIteration):
+            next(first)
+
+        second = dependencies.get_db()
+        reused = next(second)
+        try:
+            self.assertIs(reused, conn)
+            self.assertEqual(reused.execute("SELECT COUNT(*) FROM dicom_metadata").fetchone()[0], 0)
+        finally:
+            second.close()
+
+    def test_parse_elapsed_seconds_accepts_only_hms_strings(self):
+        self.assertEqual(parse_elapsed_seconds("0:01:05.75"), 65)
+        self.assertEqual(parse_elapsed_seconds("12:00:00"), 43200)
+        for value in ("", None, 90, "1 day, 2:03:04", "1:30"):
+            self.assertEqual(parse_elapsed_seconds(value), 0)
+
+    def test_metadata_lookup_matches_case_id_and_misses_cleanly(self):
+        self._insert_case(
+            "1.2.3",
+            json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}),
+            Weight=70.0,
+        )
+
+        response = self.client.get("/api/patients/Case_1/metadata")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["StudyInstanceUID"], "1.2.3")
+        self.assertEqual(response.json()["Weight"], 70.0)
+
+        self.assertEqual(self.client.get("/api/patients/Missing/metadata").status_code, 404)
+
+    def test_metadata_lookup_ignores_rows_with_malformed_json(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}))
+        self._insert_case("9.9.9", "{not json")
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            row = store.find_case_row_by_case_id(conn, "Case_1")
+            malformed = conn.execute(
+                "SELECT CaseID FROM dicom_metadata WHERE StudyInstanceUID = '9.9.9'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(row["StudyInstanceUID"], "1.2.3")
+        self.assertIsNone(malformed["CaseID"])
+
+    def test_case_id_lookup_uses_generated_column_index(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}))
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            plan = " ".join(
+                str(row[-1])
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT StudyInstanceUID FROM dicom_metadata WHERE CaseID = ?",
+                    ("Case_1",),
+                ).fetchall()
+            )
+            store.ensure_schema(conn)
+            case_ids = conn.execute("SELECT CaseID FROM dicom_metadata").fetchall()
+        finally:
+            conn.close()
+        self.assertIn("idx_dicom_metadata_case_id", plan)
+        self.assertEqual(case_ids, [("Case_1",)])
+
+    def test_results_lists_case_images_recursively_in_sorted_order(self):
+        case_folder = self.studies_dir / "Case_1"
+        (case_folder / "metadata").mkdir(parents=True)
+        (case_folder / "metadata" / "resultados.json").write_text(json.dumps({"liver_vol_cm3": 1500.0}))
+        (case_folder / "artifacts" / "total").mkdir(parents=True)
+        (case_folder / "artifacts" / "total" / "b.png").write_bytes(b"png")
+        (case_folder / "artifacts" / "a.png").write_bytes(b"png")
+        (case_folder / "artifacts" / "notes.txt").write_text("x")
+        (case_folder / "cover.png").write_bytes(b"png")
+
+        response = self.client.get("/api/patients/Case_1/results")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["liver_vol_cm3"], 1500.0)
+        self.assertEqual(body["images"], ["artifacts/a.png", "artifacts/total/b.png", "cover.png"])
+
+    def test_large_results_are_gzipped_but_downloads_pass_through(self):
+        case_folder = self.studies_dir / "Case_1"
+        (case_folder / "metadata").mkdir(parents=True)
+        metrics = {f"organ_{index}_vol_cm3": float(index) for index in range(200)}
+        (case_folder / "metadata" / "resultados.json").write_text(json.dumps(metrics))
+        (case_folder / "derived").mkdir()
+        (case_folder / "derived" / "Case_1.nii.gz").write_bytes(b"\x1f\x8b" + b"0" * 4096)
+
+        response = self.client.get("/api/patients/Case_1/results", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.json()["organ_199_vol_cm3"], 199.0)
+
+        download = self.client.get("/api/patients/Case_1/nifti", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(download.status_code, 200)
+        self.assertNotIn("content-encoding", download.headers)
+        self.assertEqual(download.headers["content-length"], "4098")
+
+    def test_nifti_download_revalidates_with_etag(self):
+        derived = self.studies_dir / "Case_1" / "derived"
+        derived.mkdir(parents=True)
+        (derived / "Case_1.nii.gz").write_bytes(b"\x1f\x8bnifti")
+
+        response = self.client.get("/api/patients/Case_1/nifti")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"\x1f\x8bnifti")
+        self.assertEqual(response.headers["content-length"], "7")
+        etag = response.headers["etag"]
+
+        revalidated = self.client.get("/api/patients/Case_1/nifti", headers={"If-None-Match": etag})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.headers["etag"], etag)
+
+        for header in (f'"stale", W/{etag}', f'"stale",{etag}', "*"):
+            listed = self.client.get("/api/patients/Case_1/nifti", headers={"If-None-Match": header})
+            self.assertEqual(listed.status_code, 304, header)
+        mismatched = self.client.get("/api/patients/Case_1/nifti", headers={"If-None-Match": '"stale", W/"other"'})
+        self.assertEqual(mismatched.status_code, 200)
+        self.assertEqual(mismatched.content, b"\x1f\x8bnifti")
+
+        self.assertEqual(self.client.get("/api/patients/Missing/nifti").status_code, 404)
+
+    def test_biometrics_patch_skips_rewrites_when_values_are_unchanged(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}))
+        metadata_dir = self.studies_dir / "Case_1" / "metadata"
+        metadata_dir.mkdir(parents=True)
+        id_json_path = metadata_dir / "id.json"
+        id_json_path.write_text("{}")
+
+        response = self.client.patch("/api/patients/Case_1/biometrics", json={"weight": 80.0, "height": 1.8})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["bmi"], 24.69)
+        self.assertEqual(json.loads(id_json_path.read_text())["Weight"], 80.0)
+
+        id_json_path.write_text('{"sentinel": true}')
+        repeated = self.client.patch("/api/patients/Case_1/biometrics", json={"weight": 80.0, "height": 1.8})
+        self.assertEqual(repeated.status_code, 200)
+        self.assertEqual(repeated.json()["bmi"], 24.69)
+        self.assertEqual(json.loads(id_json_path.read_text()), {"sentinel": True})
+
+        self.client.patch("/api/patients/Case_1/biometrics", json={"weight": 81.0, "height": 1.8})
+        self.assertEqual(json.loads(id_json_path.read_text())["Weight"], 81.0)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            weight, id_json = conn.execute(
+                "SELECT Weight, IdJson FROM dicom_metadata WHERE StudyInstanceUID = '1.2.3'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(weight, 81.0)
+        self.assertEqual(
+            json.loads(id_json),
+            {"CaseID": "Case_1", "StudyInstanceUID": "1.2.3", "Weight": 81.0, "Height": 1.8},
+        )
+
+    def test_smi_patch_persists_rounded_value(self):
+        self._insert_case(
+            "1.2.3",
+            json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}),
+            CalculationResults=json.dumps({"muscle_area_cm2": 150.0}),
+        )
+
+        response = self.client.patch("/api/patients/Case_1/smi", json={"smi": 45.678})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["smi"], 45.68)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            smi, results_json = conn.execute(
+                "SELECT SMI, CalculationResults FROM dicom_metadata WHERE StudyInstanceUID = '1.2.3'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(smi, 45.678)
+        self.assertEqual(json.loads(results_json), {"muscle_area_cm2": 150.0, "SMI_cm2_m2": 45.68})
+
+        self.assertEqual(self.client.patch("/api/patients/Missing/smi", json={"smi": 40.0}).status_code, 404)
+
+    def test_smi_patch_creates_results_when_none_are_stored(self):
+        self._insert_case("1.2.3", json.dumps({"CaseID": "Case_1", "StudyInstanceUID": "1.2.3"}))
+
+        response = self.client.patch("/api/patients/Case_1/smi", json={"smi": 40.0})
+        self.assertEqual(response.status_code, 200)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            (results_json,) = conn.execute(
+                "SELECT CalculationResults FROM dicom_metadata WHERE StudyInstanceUID = '1.2.3'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(json.loads(results_json), {"SMI_cm2_m2": 40.0})
+
+    def test_download_folder_streams_zip_with_nested_files(self):
+        folder = self.studies_dir / "Case_1" / "artifacts" / "total"
+        (folder / "masks").mkdir(parents=True)
+        (folder / "masks" / "liver.nii.gz").write_bytes(b"\x1f\x8b" + b"mask" * 1000)
+        (folder / "summary.json").write_text('{"ok": true}')
+
+        response = self.client.get("/api/patients/Case_1/download/total")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/zip")
+        self.assertIn("Case_1_total.zip", response.headers["content-disposition"])
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            self.assertEqual(sorted(archive.namelist()), ["masks/liver.nii.gz", "summary.json"])
+            self.assertEqual(archive.read("summary.json"), b'{"ok": true}')
+            self.assertEqual(archive.read("masks/liver.nii.gz"), b"\x1f\x8b" + b"mask" * 1000)
+            self.assertEqual(archive.getinfo("masks/liver.nii.gz").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(archive.getinfo("summary.json").compress_type, zipfile.ZIP_DEFLATED)
+
+    def test_download_folder_rejects_unknown_and_missing_folders(self):
+        self.assertEqual(self.client.get("/api/patients/Case_1/download/source").status_code, 400)
+        self.assertEqual(self.client.get("/api/patients/Case_1/download/bleed").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -52,9 +52,10 @@ class TestPrepareDuplicateSkip(unittest.TestCase):
                     task_names=["total", "tissue_types"],
                     elapsed_time="0:04:12",
                 )
-                store.update_metrics_completion(
+                store.record_metrics_completion(
                     conn,
                     study_uid,
+                    {"StudyInstanceUID": study_uid, "CaseID": case_id},
                     profile_name="ct_native_basic_metrics",
                 )
 
@@ -135,9 +136,10 @@ class TestPrepareDuplicateSkip(unittest.TestCase):
                     task_names=["total", "tissue_types"],
                     elapsed_time="0:04:12",
                 )
-                store.update_metrics_completion(
+                store.record_metrics_completion(
                     conn,
                     study_uid,
+                    {"StudyInstanceUID": study_uid, "CaseID": case_id},
                     profile_name="ct_native_basic_metrics",
                 )
                 store.enqueue_dicom_export(
@@ -1,3 +1,5 @@
+import io
+import os
 import tempfile
 import threading
 import unittest
@@ -9,7 +11,7 @@ from pydicom.dataset import Dataset
 
 from heimdallr.prepare import worker
 from heimdallr.shared import store
-from heimdallr.shared.spool import CLAIM_SUFFIX
+from heimdallr.shared.spool import CLAIM_SUFFIX, atomic_copy_stream, atomic_write_text
 
 
 class TestPrepareSpoolOrder(unittest.TestCase):
@@ -279,5 +281,54 @@ class TestPrepareSpoolOrder(unittest.TestCase):
             self.assertTrue((failed_dir / "study.zip").exists())
 
 
+class TestAtomicCopyStream(unittest.TestCase):
+    def test_copies_rolled_and_in_memory_spooled_uploads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "upload.zip"
+            payload = bytes(range(256)) * 4096
+
+            with tempfile.SpooledTemporaryFile(max_size=1024) as rolled:
+                rolled.write(payload)
+                rolled.seek(0)
+                atomic_copy_stream(target, rolled)
+                self.assertEqual(rolled.tell(), len(payload))
+            self.assertEqual(target.read_bytes(), payload)
+
+            with tempfile.SpooledTemporaryFile(max_size=len(payload) * 2) as in_memory:
+                in_memory.write(payload)
+                in_memory.seek(16)
+                atomic_copy_stream(target, in_memory)
+                self.assertFalse(in_memory._rolled)
+            self.assertEqual(target.read_bytes(), payload[16:])
+            self.assertEqual(sorted(path.name for path in Path(tmp).iterdir()), ["upload.zip"])
+
+    def test_sendfile_copies_plain_files_and_falls_back_without_fileno(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "upload.zip"
+            payload = bytes(range(256)) * 64
+
+            with open(Path(tmp) / "source.bin", "w+b") as source:
+                source.write(payload)
+                source.seek(0)
+                source.write(b"head")
+                with patch("heimdallr.shared.spool.os.sendfile", wraps=os.sendfile) as sendfile:
+                    atomic_copy_stream(target, source)
+                self.assertTrue(sendfile.called)
+            self.assertEqual(target.read_bytes(), payload[4:])
+
+            atomic_copy_stream(target, io.BytesIO(payload))
+            self.assertEqual(target.read_bytes(), payload)
+
+    def test_atomic_write_text_replaces_without_leaving_temporary_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "id.json"
+            target.write_text('{"old": true}', encoding="utf-8")
+
+            atomic_write_text(target, '{"CaseID": "Caso_Ç"}')
+
+            self.assertEqual(target.read_text(encoding="utf-8"), '{"CaseID": "Caso_Ç"}')
+            self.assertEqual([path.name for path in Path(tmp).iterdir()], ["id.json"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import json
 import gzip
 import sqlite3
 import tempfile
+import threading
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -537,6 +538,208 @@ class TestSegmentationReuse(unittest.TestCase):
             ["total", "cerebral_bleed", "brain_structures"],
         )
 
+    def test_run_segmentation_pipeline_overlaps_tasks_after_total_when_configured(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            case_output = Path(tmpdir) / "CaseParallel"
+            artifacts_dir = case_output / "artifacts"
+            log_dir = case_output / "logs"
+            nifti_path = case_output / "derived" / "CaseParallel.nii.gz"
+            write_nifti(nifti_path, np.zeros((10, 10, 10), dtype=np.float32))
+            calls: list[str] = []
+            both_head_tasks_running = threading.Barrier(2, timeout=5)
+
+            def fake_run_task(task_name, _input_file, output_folder, extra_args=None, log_file=None):
+                calls.append(task_name)
+                if task_name == "total":
+                    skull = np.zeros((10, 10, 10), dtype=np.float32)
+                    brain = np.zeros((10, 10, 10), dtype=np.float32)
+                    skull[0:8, 2:8, 2:8] = 1.0
+                    brain[3:7, 3:7, 3:7] = 1.0
+                    write_nifti(Path(output_folder) / "skull.nii.gz", skull)
+                    write_nifti(Path(output_folder) / "brain.nii.gz", brain)
+                else:
+                    # Fails with BrokenBarrierError unless both tasks overlap.
+                    both_head_tasks_running.wait()
+                    Path(output_folder, "mask.nii.gz").write_bytes(gzip.compress(b"ok"))
+
+            with (
+                patch(
+                    "heimdallr.segmentation.worker.resolve_segmentation_plan",
+                    return_value=(
+                        "ct_native_segmentation_only",
+                        [
+                            {"name": "total", "output_dir": "artifacts/total"},
+                            {"name": "cerebral_bleed", "output_dir": "artifacts/cerebral_bleed"},
+                            {"name": "brain_structures", "output_dir": "artifacts/brain_structures"},
+                        ],
+                    ),
+                ),
+                patch("heimdallr.segmentation.worker.run_task", side_effect=fake_run_task),
+                patch.object(segmentation_worker.settings, "SEGMENTATION_MAX_PARALLEL_TASKS", 2),
+            ):
+                info = run_segmentation_pipeline(
+                    case_id="CaseParallel",
+                    modality="CT",
+                    selected_phase="native",
+                    nifti_path=nifti_path,
+                    case_output=case_output,
+                    artifacts_dir=artifacts_dir,
+                    log_dir=log_dir,
+                    logger=PipelineLogger(None),
+                )
+
+        self.assertEqual(calls[0], "total")
+        self.assertEqual(sorted(calls[1:]), ["brain_structures", "cerebral_bleed"])
+        self.assertEqual(
+            [task["name"] for task in info["tasks"]],
+            ["total", "cerebral_bleed", "brain_structures"],
+        )
+
+    def test_empty_task_output_dir_clears_stale_outputs_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "artifacts" / "total"
+            (output_dir / "nested").mkdir(parents=True)
+            (output_dir / "liver.nii.gz").write_bytes(b"stale")
+            (output_dir / "nested" / "mask.nii.gz").write_bytes(b"stale")
+            inode = output_dir.stat().st_ino
+
+            segmentation_worker._empty_task_output_dir(output_dir)
+
+            self.assertEqual(list(output_dir.iterdir()), [])
+            self.assertEqual(output_dir.stat().st_ino, inode)
+
+            fresh_dir = Path(tmpdir) / "artifacts" / "tissue_types"
+            segmentation_worker._empty_task_output_dir(fresh_dir)
+            self.assertTrue(fresh_dir.is_dir())
+
+    def test_uncompressed_segmentation_input_is_scratch_copy_removed_after_use(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nifti_path = Path(tmpdir) / "Case.nii.gz"
+            nifti_path.write_bytes(gzip.compress(b"voxels"))
+            scratch_dir = Path(tmpdir) / "shm"
+
+            with patch.object(segmentation_worker.settings, "SEGMENTATION_INPUT_SCRATCH_DIR", str(scratch_dir)):
+                with segmentation_worker._uncompressed_segmentation_input(
+                    "Case", nifti_path, 3, logger=PipelineLogger(None)
+                ) as task_input:
+                    self.assertEqual(task_input.parent, scratch_dir)
+                    self.assertEqual(task_input.suffix, ".nii")
+                    self.assertEqual(task_input.read_bytes(), b"voxels")
+                self.assertFalse(task_input.exists())
+
+                with segmentation_worker._uncompressed_segmentation_input(
+                    "Case", nifti_path, 1, logger=PipelineLogger(None)
+                ) as single_task_input:
+                    self.assertEqual(single_task_input, nifti_path)
+
+            with segmentation_worker._uncompressed_segmentation_input(
+                "Case", nifti_path, 3, logger=PipelineLogger(None)
+            ) as disabled_input:
+                self.assertEqual(disabled_input, nifti_path)
+
+    def test_uncompressed_segmentation_input_fallback_does_not_chain_copy_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nifti_path = Path(tmpdir) / "Case.nii.gz"
+            nifti_path.write_bytes(gzip.compress(b"voxels"))
+
+            with (
+                patch.object(segmentation_worker.settings, "SEGMENTATION_INPUT_SCRATCH_DIR", str(Path(tmpdir) / "shm")),
+                patch("heimdallr.segmentation.worker._gunzip_to", side_effect=OSError("no space left")),
+            ):
+                with self.assertRaises(RuntimeError) as raised:
+                    with segmentation_worker._uncompressed_segmentation_input(
+                        "Case", nifti_path, 3, logger=PipelineLogger(None)
+                    ) as task_input:
+                        self.assertEqual(task_input, nifti_path)
+                        raise RuntimeError("pipeline failed")
+
+            self.assertIsNone(raised.exception.__context__)
+            self.assertEqual(list((Path(tmpdir) / "shm").iterdir()), [])
+
+    def test_run_automatic_ct_pipeline_keeps_case_input_as_inventory_reference_with_scratch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            case_output = Path(tmpdir) / "CaseScratch"
+            artifacts_dir = case_output / "artifacts"
+            log_dir = case_output / "logs"
+            nifti_path = case_output / "derived" / "CaseScratch.nii.gz"
+            write_nifti(nifti_path, np.zeros((10, 10, 10), dtype=np.float32))
+            task_inputs: list[Path] = []
+
+            def fake_run_task(task_name, input_file, output_folder, extra_args=None, log_file=None):
+                task_inputs.append(Path(input_file))
+                if task_name == "total":
+                    l3 = np.zeros((10, 10, 10), dtype=np.float32)
+                    l3[3:7, 3:7, 3:7] = 1.0
+                    write_nifti(Path(output_folder) / "vertebrae_L3.nii.gz", l3)
+                else:
+                    Path(output_folder, "mask.nii.gz").write_bytes(gzip.compress(b"ok"))
+
+            metrics_profile = {
+                "jobs": [
+                    {
+                        "name": "l3_muscle_area",
+                        "requires_segmentation_tasks": ["total", "tissue_types"],
+                        "requires_inventory": ["vertebrae_L3.complete"],
+                    },
+                ],
+            }
+
+            with (
+                patch(
+                    "heimdallr.segmentation.worker.resolve_segmentation_plan",
+                    return_value=(
+                        "ct_automatic_segmentation",
+                        [
+                            {"name": "total", "output_dir": "artifacts/total"},
+                            {"name": "tissue_types", "output_dir": "artifacts/tissue_types"},
+                        ],
+                    ),
+                ),
+                patch(
+                    "heimdallr.segmentation.worker.load_metrics_pipeline_profile_for_segmentation",
+                    return_value=("ct_automatic_metrics", metrics_profile),
+                ),
+                patch("heimdallr.segmentation.worker.run_task", side_effect=fake_run_task),
+                patch.object(
+                    segmentation_worker.settings,
+                    "SEGMENTATION_INPUT_SCRATCH_DIR",
+                    str(Path(tmpdir) / "shm"),
+                ),
+            ):
+                with segmentation_worker._uncompressed_segmentation_input(
+                    "CaseScratch", nifti_path, 2, logger=PipelineLogger(None)
+                ) as task_input:
+                    info = run_segmentation_pipeline(
+                        case_id="CaseScratch",
+                        modality="CT",
+                        selected_phase="native",
+                        nifti_path=nifti_path,
+                        case_output=case_output,
+                        artifacts_dir=artifacts_dir,
+                        log_dir=log_dir,
+                        logger=PipelineLogger(None),
+                        task_input_path=task_input,
+                    )
+
+            self.assertNotEqual(task_input, nifti_path)
+            self.assertEqual(task_inputs, [task_input, task_input])
+            self.assertTrue(info["gatekeepers"]["l3_complete"]["complete"])
+            inventory = json.loads((artifacts_dir / "segmentation_inventory.json").read_text())
+            self.assertEqual(inventory["reference"]["path"], str(nifti_path))
+            self.assertEqual(inventory["reference"]["shape"], [10, 10, 10])
+
+    def test_gunzip_to_falls_back_to_gzip_without_pigz(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "Case.nii.gz"
+            source.write_bytes(gzip.compress(b"voxels" * 1000))
+            target = Path(tmpdir) / "Case.nii"
+
+            with patch("heimdallr.segmentation.worker.shutil.which", return_value=None):
+                with open(target, "wb") as handle:
+                    segmentation_worker._gunzip_to(source, handle)
+
+            self.assertEqual(target.read_bytes(), b"voxels" * 1000)
+
     def test_run_automatic_ct_pipeline_uses_inventory_to_select_tasks(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             case_output = Path(tmpdir) / "CaseAutomatic"
@@ -15,6 +15,26 @@ def _connect_row_db(path: Path) -> sqlite3.Connection:
 
 
 class TestStoreQueueRecovery(unittest.TestCase):
+    def test_ensure_schema_reruns_only_when_the_schema_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "dicom.db"
+            conn = _connect_row_db(db_path)
+            try:
+                store.ensure_schema(conn)
+                with patch.object(store, "_ensure_columns", side_effect=AssertionError("schema re-run")):
+                    store.ensure_schema(conn)
+
+                conn.execute("DROP TABLE metrics_queue")
+                conn.commit()
+                store.ensure_schema(conn)
+                tables = {
+                    row[0]
+                    for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                }
+            finally:
+                conn.close()
+        self.assertIn("metrics_queue", tables)
+
     def test_register_study_handoff_suppresses_prepared_duplicate(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "dicom.db"
@@ -473,6 +493,58 @@ class TestStoreQueueRecovery(unittest.TestCase):
             self.assertEqual(json.loads(row["IdJson"])["SegmentationStatus"], "done")
             conn.close()
 
+    def test_update_calculation_results_binds_preserialized_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "dicom.db"
+            conn = _connect_row_db(db_path)
+            store.ensure_schema(conn)
+            conn.execute("INSERT INTO dicom_metadata (StudyInstanceUID) VALUES (?)", ("1.2.7",))
+            results = {"metrics": {"liver": {"volume_cm3": 1500.0}}}
+            results_json = json.dumps(results, indent=2)
+
+            store.update_calculation_results(conn, "1.2.7", results, results_json=results_json)
+
+            row = conn.execute(
+                "SELECT CalculationResults FROM dicom_metadata WHERE StudyInstanceUID = ?",
+                ("1.2.7",),
+            ).fetchone()
+            self.assertEqual(row["CalculationResults"], results_json)
+            conn.close()
+
+    def test_record_metrics_completion_updates_id_json_and_completion_together(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "dicom.db"
+            conn = _connect_row_db(db_path)
+            store.ensure_schema(conn)
+            conn.execute(
+                "INSERT INTO dicom_metadata (StudyInstanceUID, Weight, IdJson) VALUES (?, ?, ?)",
+                ("1.2.6", 68.0, json.dumps({"CaseID": "CaseB"})),
+            )
+            conn.commit()
+
+            store.record_metrics_completion(
+                conn,
+                "1.2.6",
+                {"CaseID": "CaseB", "Height": 1.7, "Pipeline": {"metrics_status": "done"}},
+                profile_name="default",
+            )
+
+            row = conn.execute(
+                """
+                SELECT Weight, Height, IdJson, MetricsProfile, MetricsCompletedAt
+                FROM dicom_metadata
+                WHERE StudyInstanceUID = ?
+                """,
+                ("1.2.6",),
+            ).fetchone()
+            self.assertEqual(row["Weight"], 68.0)
+            self.assertEqual(row["Height"], 1.7)
+            self.assertEqual(json.loads(row["IdJson"])["Pipeline"]["metrics_status"], "done")
+            self.assertEqual(row["MetricsProfile"], "default")
+            self.assertTrue(row["MetricsCompletedAt"])
+            self.assertFalse(conn.in_transaction)
+            conn.close()
+
     def test_claim_next_pending_metrics_queue_item_reclaims_stale_claim(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "dicom.db"
@@ -1,10 +1,13 @@
 import unittest
 
 import numpy as np
+from PIL import Image
 from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.uid import ExplicitVRLittleEndian
 
 from scripts.verify_dicom_burned_in_text import (
+    _windowed_uint8,
+    downscale_for_ocr,
     frames_for_ocr,
     has_ocr_text,
     normalize_text,
@@ -42,6 +45,29 @@ class TestVerifyDicomBurnedInText(unittest.TestCase):
         self.assertEqual(frames[0].shape, (2, 2))
         self.assertEqual(frames[0].dtype, np.uint8)
 
+    def test_windowed_uint8_lookup_matches_float_windowing_for_signed_pixels(self):
+        ds = Dataset()
+        ds.PhotometricInterpretation = "MONOCHROME1"
+        ds.RescaleSlope = 1
+        ds.RescaleIntercept = -1024
+        ds.WindowCenter = 40
+        ds.WindowWidth = 400
+        pixels = np.array([[-2000, 0], [1064, 3000]], dtype=np.int16)
+
+        windowed = _windowed_uint8(pixels, ds)
+
+        expected = _windowed_uint8(pixels.astype(np.float32), ds)
+        np.testing.assert_array_equal(windowed, expected)
+        self.assertEqual(windowed[1, 0], 127)
+
+    def test_downscale_for_ocr_bounds_short_edge_and_keeps_small_frames(self):
+        large = Image.new("L", (3000, 2400))
+        small = Image.new("L", (512, 512))
+
+        self.assertEqual(downscale_for_ocr(large, max_short_edge=1024).size, (1280, 1024))
+        self.assertIs(downscale_for_ocr(small, max_short_edge=1024), small)
+        self.assertIs(downscale_for_ocr(large, max_short_edge=0), large)
+
 
 if __name__ == "__main__":
     unittest.main()